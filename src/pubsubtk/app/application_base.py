@@ -20,10 +20,10 @@ from ttkthemes import ThemedTk
 
 from pubsubtk.core.default_topic_base import PubSubDefaultTopicBase
 from pubsubtk.processor.processor_base import ProcessorBase
-from pubsubtk.store.store import get_store
+from pubsubtk.store.store import Store, get_store
 from pubsubtk.topic.topics import DefaultNavigateTopic, DefaultProcessorTopic
-from pubsubtk.ui.base.container_base import ContainerMixin
 from pubsubtk.ui.base.template_base import TemplateMixin
+from pubsubtk.ui.types import is_container_component
 
 if TYPE_CHECKING:
     from pubsubtk.ui.types import (
@@ -53,9 +53,48 @@ def _default_poll(loop: asyncio.AbstractEventLoop, root: tk.Tk, interval: int) -
     root.after(interval, _default_poll, loop, root, interval)
 
 
+def _flush_store_poll(
+    store: Store, root: tk.Tk, interval: int, min_interval: int, max_interval: int
+) -> None:
+    """他スレッドから積まれた状態更新を ``after`` で定期的に適用する補助関数。
+
+    更新がなければ間隔を倍に延ばし（``max_interval`` まで）、更新があれば
+    ``min_interval`` に戻す。他スレッドから更新しないアプリでは Tk ループを
+    起こす回数が少なくて済む。
+
+    Args:
+        store: 更新を適用する ``Store``。
+        root: ``after`` を呼び出す Tk ウィジェット（通常はアプリケーション本体）。
+        interval: 今回のポーリング間隔（ミリ秒）。
+        min_interval: 更新があった直後のポーリング間隔（ミリ秒）。
+        max_interval: 更新がない間に延ばす間隔の上限（ミリ秒）。
+    """
+
+    interval = min(interval * 2, max_interval)
+    try:
+        if store.flush():
+            interval = min_interval
+    finally:
+        # 更新の適用に失敗してもポーリングは止めない
+        root.after(
+            interval,
+            _flush_store_poll,
+            store,
+            root,
+            interval,
+            min_interval,
+            max_interval,
+        )
+
+
 class ApplicationCommon(PubSubDefaultTopicBase, Generic[TState]):
     """Tk/Ttk いずれのウィンドウクラスでも共通の機能を提供する Mixin."""
 
+    # 他スレッドからの状態更新を適用する間隔（ミリ秒）。更新がない間は
+    # store_flush_max_interval まで延ばし、更新があれば元に戻す
+    store_flush_interval: int = 16
+    store_flush_max_interval: int = 200
+
     def __init__(self, state_cls: Type[TState], *args, **kwargs):
         """状態クラスを受け取り、Pub/Sub 機能を初期化する。
 
@@ -66,6 +105,8 @@ class ApplicationCommon(PubSubDefaultTopicBase, Generic[TState]):
         super().__init__(*args, **kwargs)
         self.state_cls = state_cls
         self.store = get_store(state_cls)
+        # 状態更新と購読者の呼び出しは Tk のメインスレッドで行う
+        self.store.set_owner_thread()
         self._processors: Dict[str, ProcessorBase] = {}
 
     def init_common(self, title: str, geometry: str) -> None:
@@ -88,6 +129,17 @@ class ApplicationCommon(PubSubDefaultTopicBase, Generic[TState]):
         # サブウィンドウ管理用辞書
         self._subwindows: Dict[str, Tuple[tk.Toplevel, tk.Widget]] = {}
 
+        # 他スレッドから積まれた状態更新の適用を開始
+        self.after(
+            self.store_flush_interval,
+            _flush_store_poll,
+            self.store,
+            self,
+            self.store_flush_interval,
+            self.store_flush_interval,
+            self.store_flush_max_interval,
+        )
+
     def setup_subscriptions(self) -> None:
         """PubSub の購読設定を行う。
 
@@ -123,9 +175,7 @@ class ApplicationCommon(PubSubDefaultTopicBase, Generic[TState]):
         kwargs = kwargs or {}
 
         # ContainerMixinを継承しているかチェック
-        is_container = issubclass(cls, ContainerMixin)
-
-        if is_container:
+        if is_container_component(cls):
             # Containerの場合はstoreを渡す
             return cls(parent=parent, store=self.store, **kwargs)
         else:
@@ -4,7 +4,7 @@
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Dict, List
+from typing import Callable, Dict, Tuple
 
 from pubsub import pub
 
@@ -12,6 +12,11 @@ from pubsub import pub
 _pubsub_logger = logging.getLogger("pubsubtk.pubsub")
 
 
+def _handler_name(handler: Callable) -> str:
+    """ログ表示用のハンドラー名（functools.partial など __name__ がない場合も扱う）"""
+    return getattr(handler, "__name__", None) or repr(handler)
+
+
 class PubSubBase(ABC):
     """
     PubSubパターンの基底クラス。
@@ -24,51 +29,70 @@ class PubSubBase(ABC):
     """
 
     def __init__(self, *args, **kwargs):
-        self._subscriptions: List[Dict[str, Any]] = []
+        # {(topic, handler): None}（登録順を保ちつつ重複登録と解除を O(1) で扱う）
+        self._subscriptions: Dict[Tuple[str, Callable], None] = {}
         self.setup_subscriptions()
 
     def subscribe(self, topic: str, handler: Callable, **kwargs) -> None:
+        key = (topic, handler)
+        if key in self._subscriptions:
+            # 同じトピックへの同じハンドラーは pypubsub 側でも 1 つにまとめられる
+            return
         pub.subscribe(handler, topic, **kwargs)
-        self._subscriptions.append({"topic": topic, "handler": handler})
+        self._subscriptions[key] = None
 
         # DEBUGログ：購読登録
-        _pubsub_logger.debug(
-            f"SUBSCRIBE: {self.__class__.__name__} -> topic='{topic}', handler={handler.__name__}"
-        )
+        if _pubsub_logger.isEnabledFor(logging.DEBUG):
+            _pubsub_logger.debug(
+                "SUBSCRIBE: %s -> topic='%s', handler=%s",
+                self.__class__.__name__,
+                topic,
+                _handler_name(handler),
+            )
 
     def publish(self, topic: str, **kwargs) -> None:
         # DEBUGログ：パブリッシュ（引数も表示）
-        args_str = ", ".join(f"{k}={v}" for k, v in kwargs.items())
-        _pubsub_logger.debug(
-            f"PUBLISH: {self.__class__.__name__} -> topic='{topic}'"
-            + (f" with args: {args_str}" if args_str else "")
-        )
+        # 無効時は引数の文字列化を行わない（publish はホットパスのため）
+        if _pubsub_logger.isEnabledFor(logging.DEBUG):
+            if kwargs:
+                _pubsub_logger.debug(
+                    "PUBLISH: %s -> topic='%s' with args: %s",
+                    self.__class__.__name__,
+                    topic,
+                    ", ".join(f"{k}={v}" for k, v in kwargs.items()),
+                )
+            else:
+                _pubsub_logger.debug(
+                    "PUBLISH: %s -> topic='%s'", self.__class__.__name__, topic
+                )
 
         pub.sendMessage(topic, **kwargs)
 
     def unsubscribe(self, topic: str, handler: Callable) -> None:
         pub.unsubscribe(handler, topic)
-        self._subscriptions = [
-            s
-            for s in self._subscriptions
-            if not (s["topic"] == topic and s["handler"] == handler)
-        ]
+        self._subscriptions.pop((topic, handler), None)
 
         # DEBUGログ：購読解除
-        _pubsub_logger.debug(
-            f"UNSUBSCRIBE: {self.__class__.__name__} -> topic='{topic}', handler={handler.__name__}"
-        )
+        if _pubsub_logger.isEnabledFor(logging.DEBUG):
+            _pubsub_logger.debug(
+                "UNSUBSCRIBE: %s -> topic='%s', handler=%s",
+                self.__class__.__name__,
+                topic,
+                _handler_name(handler),
+            )
 
     def unsubscribe_all(self) -> None:
         # DEBUGログ：全購読解除
         if self._subscriptions:
             _pubsub_logger.debug(
-                f"UNSUBSCRIBE_ALL: {self.__class__.__name__} -> {len(self._subscriptions)} subscriptions"
+                "UNSUBSCRIBE_ALL: %s -> %d subscriptions",
+                self.__class__.__name__,
+                len(self._subscriptions),
             )
 
-        for s in list(self._subscriptions):
-            pub.unsubscribe(s["handler"], s["topic"])
-        self._subscriptions.clear()
+        subscriptions, self._subscriptions = self._subscriptions, {}
+        for topic, handler in subscriptions:
+            pub.unsubscribe(handler, topic)
 
     @abstractmethod
     def setup_subscriptions(self) -> None:
@@ -7,8 +7,27 @@ Pydantic モデルを用いた型安全な状態管理を提供します。
 """
 
 import copy
+import inspect
+import logging
+import queue
+import threading
+import weakref
 from collections import defaultdict
-from typing import Any, Generic, Type, TypeVar, cast
+from contextlib import contextmanager
+from functools import cached_property, lru_cache
+from types import UnionType
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Iterator,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+    get_args,
+    get_origin,
+)
 
 from pydantic import BaseModel
 
@@ -17,6 +36,230 @@ from pubsubtk.topic.topics import DefaultUndoTopic, DefaultUpdateTopic
 
 TState = TypeVar("TState", bound=BaseModel)
 
+_logger = logging.getLogger("pubsubtk.store")
+
+
+@lru_cache(maxsize=1024)
+def _split_path(path: str) -> tuple[str, ...]:
+    """ドット区切りのパス文字列をセグメントのタプルに分割する。
+
+    状態パスは同じ文字列が繰り返し渡されるため、分割結果をキャッシュして
+    更新のたびに ``str.split`` が走らないようにする。
+    """
+    return tuple(path.split("."))
+
+
+_MODEL_FIELD_NAMES: "weakref.WeakKeyDictionary[type, frozenset[str]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _field_names(model_cls: type) -> frozenset[str]:
+    """モデルクラスのフィールド名集合を返す。
+
+    クラスごとに一度だけ作成し、パス解決時の存在確認を ``hasattr`` ではなく
+    集合の検索で済ませる。クラスが破棄されるとキャッシュからも消える。
+    """
+    names = _MODEL_FIELD_NAMES.get(model_cls)
+    if names is None:
+        names = frozenset(model_cls.model_fields)
+        _MODEL_FIELD_NAMES[model_cls] = names
+    return names
+
+
+# Store._setters で「専用関数を作成できなかったパス」と区別するための番兵
+_NOT_COMPILED: Any = object()
+
+# フィールドごとの検証方法 (型チェック用の型, model_validate) のクラス別キャッシュ
+_FieldPlan = tuple[Union[type, None], Union[Callable[[Any], Any], None]]
+_MODEL_FIELD_PLANS: "weakref.WeakKeyDictionary[type, dict[str, _FieldPlan]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _field_plans(model_cls: type) -> dict[str, _FieldPlan]:
+    """モデルクラスのフィールドごとの検証方法を返す。
+
+    アノテーションが具象型かどうかと ``model_validate`` の有無を
+    クラスごとに一度だけ調べ、更新のたびに ``model_fields`` を引かないようにする。
+    """
+    plans = _MODEL_FIELD_PLANS.get(model_cls)
+    if plans is None:
+        plans = {}
+        for name, field_info in model_cls.model_fields.items():
+            annotation = field_info.annotation
+            plans[name] = (
+                annotation if isinstance(annotation, type) else None,
+                getattr(annotation, "model_validate", None),
+            )
+        _MODEL_FIELD_PLANS[model_cls] = plans
+    return plans
+
+
+def _has_attr(obj: Any, name: str) -> bool:
+    """``obj`` が属性 ``name`` を持つか判定する。
+
+    Pydantic モデルのフィールドはフィールド名集合で判定し、それ以外
+    （プロパティや ``extra`` 属性、モデル以外のオブジェクト）は ``hasattr`` で確認する。
+    """
+    if isinstance(obj, BaseModel) and name in _field_names(type(obj)):
+        return True
+    return hasattr(obj, name)
+
+
+def _model_type(annotation: Any) -> Type[BaseModel] | None:
+    """フィールドのアノテーションが指す ``BaseModel`` 型を返す。
+
+    ``Optional[Model]`` は ``Model`` として扱い、モデル以外の型なら ``None`` を返す。
+    """
+    if get_origin(annotation) in (Union, UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) != 1:
+            return None
+        annotation = args[0]
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    return None
+
+
+def _member_model(
+    model_cls: Type[BaseModel], name: str
+) -> tuple[bool, Type[BaseModel] | None]:
+    """モデルクラスのメンバー ``name`` の有無と、その値が指す ``BaseModel`` 型を返す。
+
+    フィールドに加えて ``@computed_field`` とクラスのプロパティも対象にする。
+    プロパティの型は戻り値のアノテーションから判断する。
+
+    Returns:
+        ``(存在するか, モデル型 or None)`` のタプル。
+    """
+    field_info = model_cls.model_fields.get(name)
+    if field_info is not None:
+        return True, _model_type(field_info.annotation)
+    computed = model_cls.model_computed_fields.get(name)
+    if computed is not None:
+        return True, _model_type(computed.return_type)
+    member = inspect.getattr_static(model_cls, name, None)
+    if isinstance(member, (property, cached_property)):
+        getter = member.fget if isinstance(member, property) else member.func
+        return True, _model_type(getattr(getter, "__annotations__", {}).get("return"))
+    return False, None
+
+
+def _copy_with(
+    node: BaseModel, assigned: dict[str, Any], update: dict[str, Any] | None = None
+) -> BaseModel:
+    """フィールドを差し替えた ``node`` のコピーを返す。
+
+    ``model_copy(update=...)`` は検証を行わないため、``validate_assignment``
+    が有効なモデルでは ``assigned`` の各値をコピーへの代入として検証する
+    （型の不一致は ``ValidationError``、変換可能な値は変換される）。
+    ``update`` は検証済みの値（作り直した子ノード）で、そのまま反映する。
+
+    Args:
+        node: コピー元のモデル。
+        assigned: 代入として設定する値。
+        update: 検証せずに反映する値。
+    """
+    if not node.model_config.get("validate_assignment"):
+        if update:
+            assigned = {**update, **assigned}
+        return node.model_copy(update=assigned)
+    new_node = node.model_copy(update=update)
+    for attr, value in assigned.items():
+        setattr(new_node, attr, value)
+    return new_node
+
+
+class _CombinedOp:
+    """``begin_batch()`` 中に 1 つのパスへ合成された更新操作。"""
+
+    __slots__ = ("paths", "has_value", "value", "trusted", "items")
+
+    def __init__(self):
+        # 呼び出しに使われたパスの表記 {表記: None}（表記ごとに通知する）
+        self.paths: dict[str, None] = {}
+        self.has_value = False
+        self.value: Any = None
+        self.trusted = False
+        self.items: list[Any] = []
+
+
+def _read_only(value: Any) -> Any:
+    """``get_state_view()`` で返す値を読み取り専用の形に変換する。
+
+    モデルは ``_ReadOnlyState`` で包む。リストや辞書などはコピーせずに
+    状態が保持するオブジェクトをそのまま返す（``==`` の比較も元の型のまま）。
+    """
+    if isinstance(value, BaseModel):
+        return _ReadOnlyState(value)
+    return value
+
+
+class _BatchLocal(threading.local):
+    """``begin_batch()`` の保留中の操作をスレッドごとに保持する。
+
+    別スレッドからの ``update_state`` がバッチ中のスレッドの保留分に
+    混ざらないよう、バッチを開始したスレッドの操作だけを溜める。
+    """
+
+    # {正規化済みパス: 操作}（バッチ外では None）
+    combining: dict[tuple[str, ...], _CombinedOp] | None = None
+
+
+class _ReadOnlyState:
+    """状態のモデルを読み取り専用で公開する軽量ラッパー。
+
+    属性の参照は元のモデルへ転送し、ネストしたモデルも ``_read_only`` で
+    包んで返す。属性の設定・削除は拒否する。
+    ``__class__`` は元のモデル型を返すため ``isinstance`` 判定も元の型と同じになる。
+    コピーや pickle は元のモデルに対して行う。
+    """
+
+    __slots__ = ("_target",)
+
+    def __init__(self, target: BaseModel):
+        object.__setattr__(self, "_target", target)
+
+    @property  # type: ignore[misc]
+    def __class__(self) -> type:  # noqa: D105
+        return type(self._target)
+
+    def __getattr__(self, name: str) -> Any:
+        return _read_only(getattr(self._target, name))
+
+    def __iter__(self) -> Iterator[Any]:
+        for name, value in self._target:
+            yield name, _read_only(value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(
+            "State returned by get_state_view() is read-only; "
+            "use update_state() or get_current_state()"
+        )
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("State returned by get_state_view() is read-only")
+
+    def __copy__(self) -> BaseModel:
+        return copy.copy(self._target)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> BaseModel:
+        return copy.deepcopy(self._target, memo)
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        return self._target.__reduce_ex__(protocol)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, _ReadOnlyState):
+            other = object.__getattribute__(other, "_target")
+        return self._target == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return repr(self._target)
+
 
 class StateProxy(Generic[TState]):
     """
@@ -25,33 +268,68 @@ class StateProxy(Generic[TState]):
     - store.state.foo.bar のようなドット記法でネスト属性へアクセス可能
     - 存在しない属性アクセス時は AttributeError を送出
     - __repr__ でパス文字列を返す
+    - 子プロキシはメモ化され、2 回目以降のアクセスは辞書引きのみ
     """
 
-    def __init__(self, store: "Store[TState]", path: str = ""):
+    def __init__(
+        self,
+        store: "Store[TState]",
+        segments: tuple[str, ...] = (),
+        model: Type[BaseModel] | None = None,
+    ):
         """StateProxy を初期化する。
 
         Args:
             store: 値を参照する対象 ``Store``。
-            path: 現在のパス文字列。
+            segments: 現在のパスのセグメントタプル。
+            model: このパスが指す ``BaseModel`` 型。モデル以外なら ``None``。
         """
 
         self._store = store
-        self._path = path
+        self._segments = segments
+        self._model = model
+        self._children: dict[str, StateProxy[TState]] = {}
 
     def __getattr__(self, name: str) -> "StateProxy[TState]":
         """属性アクセスを連結した ``StateProxy`` を返す。"""
 
-        new_path = f"{self._path}.{name}" if self._path else name
-
-        # 存在チェック：TState モデルに new_path が通るか確認
-        cur = self._store.get_current_state()
-        for seg in new_path.split("."):
-            if hasattr(cur, seg):
-                cur = getattr(cur, seg)
-            else:
-                raise AttributeError(f"No such property: store.state.{new_path}")
-
-        return StateProxy(self._store, new_path)
+        children = self.__dict__.get("_children")
+        if children is None:
+            raise AttributeError(name)
+        child = children.get(name)
+        if child is not None:
+            return child
+
+        new_segments = self._segments + (name,)
+
+        if self._model is not None:
+            # 存在チェック：モデルのスキーマ（静的な型情報）で確認
+            found, child_model = _member_model(self._model, name)
+            if not found:
+                raise AttributeError(
+                    f"No such property: store.state.{'.'.join(new_segments)}"
+                )
+        else:
+            # モデル以外の値は現在の状態をたどって確認
+            cur = self._store._state
+            for seg in new_segments:
+                if _has_attr(cur, seg):
+                    cur = getattr(cur, seg)
+                else:
+                    raise AttributeError(
+                        f"No such property: store.state.{'.'.join(new_segments)}"
+                    )
+            child_model = None
+
+        child = StateProxy(self._store, new_segments, child_model)
+        children[name] = child
+        return child
+
+    @cached_property
+    def _path(self) -> str:
+        """ドット区切りのパス文字列。"""
+
+        return ".".join(self._segments)
 
     def __repr__(self) -> str:
         """State型名を含むパス文字列を返す。"""
@@ -68,7 +346,9 @@ class Store(PubSubBase, Generic[TState]):
 
     - Pydanticモデルを状態として保持し、状態操作を提供
     - get_current_state()で状態のディープコピーを取得
+    - get_state_view()でコピーせずに状態の読み取り専用ビューを取得
     - update_state()/add_to_list()/add_to_dict()で状態を更新し、PubSubで通知
+    - 書き込みはロックで直列化し、読み取りはロックなしで一貫した状態を参照できる
     - `store.state.count` のようなパスプロキシを使うことで、
       `store.update_state(store.state.count, 1)` のようにIDEの「定義へ移動」や補完機能を活用しつつ、
       状態更新のパスを安全・明示的に指定できる（従来の文字列パス指定の弱点を解消）
@@ -82,6 +362,13 @@ class Store(PubSubBase, Generic[TState]):
         """
         self._state_class = initial_state_class
         self._state = initial_state_class()
+        # パスごとの専用差し替え関数 {正規化済みパス: 関数 or None}
+        self._setters: dict[tuple[str, ...], Callable[[Any, Any], Any] | None] = {}
+        # get_state_view() が返す (元の状態ルート, 読み取り専用ラッパー)
+        self._ro_snapshot: tuple[Any, Any] = (None, None)
+        self._state_proxy: StateProxy[TState] = StateProxy(
+            self, model=initial_state_class
+        )
 
         # Undo/Redo 履歴管理用フィールド
         self._undo_enabled: set[str] = set()  # 追跡対象パス
@@ -90,6 +377,22 @@ class Store(PubSubBase, Generic[TState]):
         self._max_histories: dict[str, int] = {}  # パス別履歴上限
         self._during_ur_op: bool = False  # Undo/Redo操作中の再帰抑制フラグ
 
+        # 書き込み側のみ直列化するロック（状態は差し替え式なので読み取りはロック不要）
+        self._write_lock = threading.RLock()
+
+        # 所有スレッド以外からの更新を受け付けるキュー（所有スレッドで flush() する）
+        self._owner_thread: int | None = None
+        self._pending_ops: queue.SimpleQueue[tuple[Callable[..., None], tuple]] = (
+            queue.SimpleQueue()
+        )
+
+        # batch() 中に保留している通知 {(topic, 連番 or None): kwargs}
+        self._batch_depth: int = 0
+        self._pending_notifications: dict[tuple[str, int | None], dict] = {}
+
+        # begin_batch() 中に保留している更新操作（スレッドごと）
+        self._local = _BatchLocal()
+
         # PubSubBase.__init__()を呼び出して購読設定を有効化
         super().__init__()
 
@@ -111,14 +414,274 @@ class Store(PubSubBase, Generic[TState]):
         """
         状態への動的パスアクセス用プロキシを返す。
         """
-        return cast(TState, StateProxy(self))
+        return cast(TState, self._state_proxy)
 
     def get_current_state(self) -> TState:
         """
         現在の状態のディープコピーを返す。
+
+        返り値を書き換えても Store の状態には影響しない。
         """
         return self._state.model_copy(deep=True)
 
+    def get_state_view(self) -> TState:
+        """現在の状態をコピーせずに読み取り専用ビューとして返す。
+
+        状態はその場で書き換えられず、更新のたびに変更パス上のノードだけを
+        作り直した新しいルートに置き換わるため、ビューは取得時点の状態を指し続ける。
+        ネストしたモデルも読み取り専用で返る。リストや辞書はコピーや変換を
+        せずに状態と共有したものが返るため、書き換えてはならない。
+        ビューは状態ルートが変わった時だけ作り直す。
+        書き換え可能な値が必要な場合は ``get_current_state()`` を使うこと。
+        """
+        state = self._state
+        source, view = self._ro_snapshot
+        if source is not state:
+            view = _ReadOnlyState(state)
+            self._ro_snapshot = (state, view)
+        return cast(TState, view)
+
+    def get_value(self, state_path: str) -> Any:
+        """指定パスの現在値をコピーせずに返す。
+
+        返り値は状態と共有されているため書き換えないこと。
+
+        Args:
+            state_path: 値を取得する属性パス（``store.state`` のプロキシも可）。
+        Raises:
+            AttributeError: パスが存在しない場合。
+            ValueError: パスが別の Store 向けの場合。
+        """
+        return self._resolve_segments(self._path_segments(state_path))[2]
+
+    def set_owner_thread(self, thread_id: int | None = None) -> None:
+        """状態更新を適用するスレッドを指定する。
+
+        指定後は他のスレッドから呼ばれた ``update_state`` などをキューに積み、
+        所有スレッドで ``flush()`` した時にまとめて適用する。購読者（Tk ウィジェット）は
+        常に所有スレッド上で呼び出される。
+
+        Args:
+            thread_id: 所有スレッドの ID。省略時は呼び出し元スレッド。
+        """
+        self._owner_thread = (
+            thread_id if thread_id is not None else threading.get_ident()
+        )
+
+    def flush(self) -> bool:
+        """他スレッドからキューに積まれた状態更新を順に適用する。
+
+        失敗した更新はログに記録して破棄し、残りの更新の適用を続ける。
+
+        Returns:
+            適用を試みた更新が 1 件以上あれば ``True``。
+        """
+        applied = False
+        while True:
+            try:
+                op, args = self._pending_ops.get_nowait()
+            except queue.Empty:
+                return applied
+            applied = True
+            try:
+                op(*args)
+            except Exception:
+                _logger.exception(
+                    "Failed to apply queued state update: %s%r", op.__name__, args
+                )
+
+    def _defer_if_foreign(self, op: Callable[..., None], *args: Any) -> bool:
+        """所有スレッド以外からの呼び出しならキューに積んで ``True`` を返す。"""
+        owner = self._owner_thread
+        if owner is None or owner == threading.get_ident():
+            return False
+        self._pending_ops.put((op, args))
+        return True
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """ブロック内の変更通知を保留し、終了時にまとめて送信する。
+
+        同じトピックへの通知は 1 回にまとめられ、``STATE_CHANGED`` は最初の
+        ``old_value`` と最後の ``new_value`` を持つ。リスト・辞書への追加通知は
+        まとめずに発生順に送信する。入れ子で使った場合は最も外側の終了時に送信する。
+
+        使用例:
+            with store.batch():
+                store.update_state("count", 1)
+                store.update_state("count", 2)  # 通知は 0 -> 2 の 1 回だけ
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._flush_notifications()
+
+    def _notify(self, topic: str, coalesce: bool = True, **kwargs: Any) -> None:
+        """変更通知を送信する。``batch()`` 中は保留する。
+
+        Args:
+            topic: 送信先トピック。
+            coalesce: ``batch()`` 中に同じトピックの通知をまとめるかどうか。
+            **kwargs: 通知に載せる引数。
+        """
+        if not self._batch_depth:
+            self.publish(topic, **kwargs)
+            return
+
+        if not coalesce:
+            key = (topic, len(self._pending_notifications))
+            self._pending_notifications[key] = kwargs
+            return
+
+        key = (topic, None)
+        pending = self._pending_notifications.get(key)
+        if pending is not None and "old_value" in pending:
+            kwargs["old_value"] = pending["old_value"]
+        self._pending_notifications[key] = kwargs
+
+    def _flush_notifications(self) -> None:
+        """保留中の通知を送信する。"""
+        pending, self._pending_notifications = self._pending_notifications, {}
+        for (topic, _), kwargs in pending.items():
+            self.publish(topic, **kwargs)
+
+    @contextmanager
+    def begin_batch(self) -> Iterator[None]:
+        """ブロック内の ``update_state`` / ``add_to_list`` を溜めて終了時にまとめて適用する。
+
+        同じパスへの ``update_state`` は最後の値だけが残り、``add_to_list`` の要素は
+        パスごとにまとめて 1 回で追加される。終了時には全パスの変更を 1 回の
+        作り直しで反映し、通知はパスごとに 1 回ずつ送信する。ブロック内では
+        ``get_current_state()`` に保留中の変更は反映されない。
+        溜めるのはブロックを実行しているスレッドの操作だけで、
+        他のスレッドからの更新はバッチに含めずそのまま適用する。
+        パスの検証は呼び出し時に行い、ブロックが例外で抜けた場合は保留中の
+        操作をすべて破棄する。入れ子で使った場合は最も外側の終了時に適用する。
+
+        使用例:
+            with store.begin_batch():
+                for i in range(100):
+                    store.update_state("progress", i)  # 適用・通知は 99 の 1 回だけ
+        """
+        if self._local.combining is not None:
+            yield
+            return
+
+        self._local.combining = {}
+        try:
+            yield
+        except BaseException:
+            # 例外で抜けた場合は保留中の操作を破棄する
+            self._local.combining = None
+            raise
+        try:
+            self._apply_combined()
+        finally:
+            self._local.combining = None
+
+    def _combine(
+        self,
+        state_path: str,
+        value: Any = None,
+        item: Any = None,
+        append: bool = False,
+        trusted: bool = False,
+    ) -> None:
+        """``begin_batch()`` 中の更新操作を保留中の操作に合成する。
+
+        Args:
+            state_path: 変更対象の属性パス。
+            value: ``update_state`` で設定する値。
+            item: ``add_to_list`` で追加する要素。
+            append: ``add_to_list`` の操作かどうか。
+            trusted: ``update_state`` の ``trusted`` 指定。
+        """
+        segments, available = self._normalize_segments(self._path_segments(state_path))
+        if not available:
+            return
+        # 存在しないパスは呼び出し時に AttributeError を送出する
+        _, _, current_value = self._resolve_segments(segments)
+
+        assert self._local.combining is not None
+        op = self._local.combining.get(segments)
+        if op is None:
+            op = self._local.combining[segments] = _CombinedOp()
+
+        if append:
+            base = op.value if op.has_value else current_value
+            if not isinstance(base, list):
+                raise TypeError(f"Property at '{state_path}' is not a list")
+            op.items.append(item)
+        else:
+            # 値の設定はそれまでの追加も含めて上書きする
+            op.has_value = True
+            op.value = value
+            op.trusted = trusted
+            op.items.clear()
+        op.paths[str(state_path)] = None
+
+    def _apply_combined(self) -> None:
+        """``begin_batch()`` で保留中の操作をまとめて適用し、通知を送信する。"""
+        combined = self._local.combining
+        if not combined:
+            return
+        self._local.combining = {}
+
+        applied: list[tuple[_CombinedOp, Any, int]] = []
+        with self._write_lock:
+            updates: dict[tuple[str, ...], Any] = {}
+            for segments, op in combined.items():
+                try:
+                    target, attr_name, old_value = self._resolve_segments(segments)
+                except ValueError:
+                    continue
+
+                if op.has_value and op.trusted:
+                    op.value = self._construct_trusted(target, attr_name, op.value)
+                new_value = op.value if op.has_value else old_value
+                start = 0
+                if op.items:
+                    start = len(new_value)
+                    new_value = [*new_value, *op.items]
+
+                updates[segments] = new_value
+                applied.append((op, old_value, start))
+
+            self._set_values(updates)
+
+            captured = [
+                path
+                for op, old_value, _ in applied
+                for path in op.paths
+                if self._capture_for_undo(path, old_value)
+            ]
+
+        # 通知はロックを解放してから送信する。同じパスを別の表記
+        # （"count" と "State.count" など）で購読していても届くよう、
+        # 使われた表記ごとに通知する
+        with self.batch():
+            for path in captured:
+                self._emit_ur_status(path)
+            for op, old_value, start in applied:
+                for path in op.paths:
+                    if op.has_value:
+                        self._notify(
+                            f"{DefaultUpdateTopic.STATE_CHANGED}.{path}",
+                            old_value=old_value,
+                            new_value=op.value,
+                        )
+                    for offset, item in enumerate(op.items):
+                        self._notify(
+                            f"{DefaultUpdateTopic.STATE_ADDED}.{path}",
+                            coalesce=False,
+                            item=item,
+                            index=start + offset,
+                        )
+                    self._notify(f"{DefaultUpdateTopic.STATE_UPDATED}.{path}")
+
     def replace_state(self, new_state: TState) -> None:
         """状態オブジェクト全体を置き換え、全フィールドに変更通知を送信する。
 
@@ -127,49 +690,91 @@ class Store(PubSubBase, Generic[TState]):
         """
         if not isinstance(new_state, self._state_class):
             raise TypeError(f"new_state must be an instance of {self._state_class}")
+        if self._defer_if_foreign(self.replace_state, new_state):
+            return
+        # 保留中の begin_batch() 操作を先に適用して順序を保つ
+        self._apply_combined()
 
-        old_state = self._state
-        self._state = new_state.model_copy(deep=True)
+        with self._write_lock:
+            old_state = self._state
+            self._state = new_state.model_copy(deep=True)
+            current_state = self._state
 
         # 全フィールドに変更通知を送信
         for field_name in self._state_class.model_fields.keys():
             old_value = getattr(old_state, field_name)
-            new_value = getattr(self._state, field_name)
+            new_value = getattr(current_state, field_name)
 
-            self.publish(
+            self._notify(
                 f"{DefaultUpdateTopic.STATE_CHANGED}.{field_name}",
                 old_value=old_value,
                 new_value=new_value,
             )
-            self.publish(f"{DefaultUpdateTopic.STATE_UPDATED}.{field_name}")
+            self._notify(f"{DefaultUpdateTopic.STATE_UPDATED}.{field_name}")
 
-    def update_state(self, state_path: str, new_value: Any) -> None:
+    def update_state(
+        self, state_path: str, new_value: Any, trusted: bool = False
+    ) -> None:
         """指定パスの属性を更新し、変更通知を送信する。
 
         Args:
             state_path: 変更対象の属性パス（例: ``"foo.bar"``）。
             new_value: 新しく設定する値。
+            trusted: ``True`` の場合、モデル型フィールドに渡された辞書を検証せずに
+                ``model_construct`` でモデル化する。信頼できるデータにのみ使用する。
         """
+        if self._defer_if_foreign(self.update_state, state_path, new_value, trusted):
+            return
+        if self._local.combining is not None and not self._during_ur_op:
+            self._combine(state_path, value=new_value, trusted=trusted)
+            return
+        with self._write_lock:
+            result = self._apply_update(state_path, new_value, trusted)
+        if result is None:
+            return
+
+        # 通知はロックを解放してから送信する
+        old_value, new_value, captured = result
+        if captured:
+            self._emit_ur_status(str(state_path))
+        self._publish_update(state_path, old_value, new_value)
+
+    def _apply_update(
+        self, state_path: str, new_value: Any, trusted: bool
+    ) -> tuple[Any, Any, bool] | None:
+        """指定パスの値を差し替える（``_write_lock`` を保持して呼ぶこと）。
+
+        Returns:
+            (変更前の値, 設定した値, Undo 履歴を記録したか)。
+            パスが別の Store 向けなら ``None``。
+        """
+        segments = self._path_segments(state_path)
         try:
-            target_obj, attr_name, old_value = self._resolve_path(str(state_path))
+            target, attr_name, old_value = self._resolve_segments(segments)
         except ValueError:
-            return
+            return None
 
-        # Undo履歴をキャプチャ（既存の値を記録）
-        self._capture_for_undo(str(state_path), old_value)
+        if trusted:
+            new_value = self._construct_trusted(target, attr_name, new_value)
 
-        # 新しい値を設定する前に型チェック
-        self._validate_and_set_value(target_obj, attr_name, new_value)
+        # 型チェックした上で変更パス上のノードだけを作り直す
+        self._set_value(segments, new_value)
 
+        # Undo履歴をキャプチャ（既存の値を記録）
+        captured = self._capture_for_undo(str(state_path), old_value)
+        return old_value, new_value, captured
+
+    def _publish_update(self, state_path: str, old_value: Any, new_value: Any) -> None:
+        """``update_state`` の変更通知を送信する。"""
         # 詳細な変更通知（old_value, new_valueを含む）
-        self.publish(
+        self._notify(
             f"{DefaultUpdateTopic.STATE_CHANGED}.{state_path}",
             old_value=old_value,
             new_value=new_value,
         )
 
         # シンプルな更新通知（引数なし）
-        self.publish(f"{DefaultUpdateTopic.STATE_UPDATED}.{state_path}")
+        self._notify(f"{DefaultUpdateTopic.STATE_UPDATED}.{state_path}")
 
     def add_to_list(self, state_path: str, item: Any) -> None:
         """リスト属性に要素を追加し、追加通知を送信する。
@@ -178,34 +783,45 @@ class Store(PubSubBase, Generic[TState]):
             state_path: 追加先となるリストの属性パス。
             item: 追加する要素。
         """
-        try:
-            target_obj, attr_name, current_list = self._resolve_path(str(state_path))
-        except ValueError:
+        if self._defer_if_foreign(self.add_to_list, state_path, item):
             return
+        if self._local.combining is not None:
+            self._combine(state_path, item=item, append=True)
+            return
+        segments = self._path_segments(state_path)
+        with self._write_lock:
+            try:
+                _, _, current_list = self._resolve_segments(segments)
+            except ValueError:
+                return
 
-        if not isinstance(current_list, list):
-            raise TypeError(f"Property at '{state_path}' is not a list")
+            if not isinstance(current_list, list):
+                raise TypeError(f"Property at '{state_path}' is not a list")
 
-        # Undo履歴をキャプチャ（既存のリストを記録）
-        self._capture_for_undo(str(state_path), current_list)
+            # リストをコピーして新しい要素を追加
+            new_list = current_list.copy()
+            new_list.append(item)
 
-        # リストをコピーして新しい要素を追加
-        new_list = current_list.copy()
-        new_list.append(item)
+            # 新しいリストで更新
+            self._set_value(segments, new_list)
 
-        # 新しいリストで更新
-        self._validate_and_set_value(target_obj, attr_name, new_list)
+            # Undo履歴をキャプチャ（既存のリストを記録）
+            captured = self._capture_for_undo(str(state_path), current_list)
 
+        # 通知はロックを解放してから送信する
+        if captured:
+            self._emit_ur_status(str(state_path))
         index = len(new_list) - 1
 
-        self.publish(
+        self._notify(
             f"{DefaultUpdateTopic.STATE_ADDED}.{state_path}",
+            coalesce=False,
             item=item,
             index=index,
         )
 
         # リスト追加でも更新通知を送信
-        self.publish(f"{DefaultUpdateTopic.STATE_UPDATED}.{state_path}")
+        self._notify(f"{DefaultUpdateTopic.STATE_UPDATED}.{state_path}")
 
     def add_to_dict(self, state_path: str, key: str, value: Any) -> None:
         """辞書属性に要素を追加し、追加通知を送信する。
@@ -215,30 +831,40 @@ class Store(PubSubBase, Generic[TState]):
             key: 追加するキー。
             value: 追加する値。
         """
-        try:
-            target_obj, attr_name, current_dict = self._resolve_path(str(state_path))
-        except ValueError:
+        if self._defer_if_foreign(self.add_to_dict, state_path, key, value):
             return
+        self._apply_combined()
+        segments = self._path_segments(state_path)
+        with self._write_lock:
+            try:
+                _, _, current_dict = self._resolve_segments(segments)
+            except ValueError:
+                return
+
+            if not isinstance(current_dict, dict):
+                raise TypeError(f"Property at '{state_path}' is not a dict")
 
-        if not isinstance(current_dict, dict):
-            raise TypeError(f"Property at '{state_path}' is not a dict")
+            new_dict = current_dict.copy()
+            new_dict[key] = value
 
-        # Undo履歴をキャプチャ（既存の辞書を記録）
-        self._capture_for_undo(str(state_path), current_dict)
+            self._set_value(segments, new_dict)
 
-        new_dict = current_dict.copy()
-        new_dict[key] = value
+            # Undo履歴をキャプチャ（既存の辞書を記録）
+            captured = self._capture_for_undo(str(state_path), current_dict)
 
-        self._validate_and_set_value(target_obj, attr_name, new_dict)
+        # 通知はロックを解放してから送信する
+        if captured:
+            self._emit_ur_status(str(state_path))
 
-        self.publish(
+        self._notify(
             f"{DefaultUpdateTopic.DICT_ADDED}.{state_path}",
+            coalesce=False,
             key=key,
             value=value,
         )
 
         # 辞書追加でも更新通知を送信
-        self.publish(f"{DefaultUpdateTopic.STATE_UPDATED}.{state_path}")
+        self._notify(f"{DefaultUpdateTopic.STATE_UPDATED}.{state_path}")
 
     # --- Undo/Redo 履歴管理機能 ---
 
@@ -249,6 +875,8 @@ class Store(PubSubBase, Generic[TState]):
             state_path: 追跡対象の状態パス
             max_history: 保持する履歴の最大数（デフォルト: 10）
         """
+        if self._defer_if_foreign(self._enable_undo_redo, state_path, max_history):
+            return
         if not self._normalize_state_path(state_path)[1]:
             return
         self._undo_enabled.add(state_path)
@@ -267,6 +895,8 @@ class Store(PubSubBase, Generic[TState]):
         Args:
             state_path: 無効化する状態パス
         """
+        if self._defer_if_foreign(self._disable_undo_redo, state_path):
+            return
         if not self._normalize_state_path(state_path)[1]:
             return
         self._undo_enabled.discard(state_path)
@@ -274,16 +904,21 @@ class Store(PubSubBase, Generic[TState]):
         self._redo_stacks.pop(state_path, None)
         self._max_histories.pop(state_path, None)
 
-    def _capture_for_undo(self, state_path: str, old_value: Any) -> None:
+    def _capture_for_undo(self, state_path: str, old_value: Any) -> bool:
         """状態変更前に古い値をUndo履歴に記録する。
 
+        ステータス通知は送信しないため、``True`` が返ったら呼び出し側が
+        ロックを解放してから ``_emit_ur_status`` を呼ぶ。
+
         Args:
             state_path: 変更対象の状態パス
             old_value: 変更前の値
+        Returns:
+            履歴を記録した場合は ``True``。
         """
         # Undo/Redo対象でない、またはUndo/Redo操作中の場合はスキップ
         if state_path not in self._undo_enabled or self._during_ur_op:
-            return
+            return False
 
         stack = self._undo_stacks[state_path]
         stack.append(copy.deepcopy(old_value))
@@ -295,12 +930,12 @@ class Store(PubSubBase, Generic[TState]):
 
         # 新しい変更が発生したのでRedo履歴をクリア
         self._redo_stacks[state_path].clear()
-
-        # ステータス通知を送信
-        self._emit_ur_status(state_path)
+        return True
 
     def _undo(self, state_path: str) -> None:
         """指定パスの状態を 1 つ前の値に戻す。"""
+        if self._defer_if_foreign(self._undo, state_path):
+            return
         if not self._normalize_state_path(state_path)[1]:
             return
 
@@ -311,20 +946,27 @@ class Store(PubSubBase, Generic[TState]):
         if len(undo_stack) < 1:
             return
 
-        # 現在の値を Redo スタックへ退避
-        try:
-            _, _, current_value = self._resolve_path(state_path)
-            self._redo_stacks[state_path].append(copy.deepcopy(current_value))
-        except (AttributeError, ValueError):
-            return
+        self._apply_combined()
 
-        # pop() した値こそ「戻すべき直前値」
-        self._during_ur_op = True
-        try:
-            previous_value = undo_stack.pop()
-            self.update_state(state_path, previous_value)
-        finally:
-            self._during_ur_op = False
+        with self._write_lock:
+            # 現在の値を Redo スタックへ退避
+            try:
+                _, _, current_value = self._resolve_path(state_path)
+                self._redo_stacks[state_path].append(copy.deepcopy(current_value))
+            except (AttributeError, ValueError):
+                return
+
+            # pop() した値こそ「戻すべき直前値」
+            self._during_ur_op = True
+            try:
+                previous_value = undo_stack.pop()
+                result = self._apply_update(state_path, previous_value, False)
+            finally:
+                self._during_ur_op = False
+
+        # 通知はロックを解放してから送信する
+        if result is not None:
+            self._publish_update(state_path, result[0], result[1])
 
         self._emit_ur_status(state_path)
 
@@ -334,6 +976,8 @@ class Store(PubSubBase, Generic[TState]):
         Args:
             state_path: Redoを実行する状態パス
         """
+        if self._defer_if_foreign(self._redo, state_path):
+            return
         if not self._normalize_state_path(state_path)[1]:
             return
 
@@ -344,20 +988,27 @@ class Store(PubSubBase, Generic[TState]):
         if not redo_stack:
             return
 
-        # 現在の値をUndo履歴に保存
-        try:
-            _, _, current_value = self._resolve_path(state_path)
-            self._undo_stacks[state_path].append(copy.deepcopy(current_value))
-        except (AttributeError, ValueError):
-            return
+        self._apply_combined()
 
-        # Redo値を取得して適用
-        self._during_ur_op = True  # 再帰防止フラグを設定
-        try:
-            redo_value = redo_stack.pop()
-            self.update_state(state_path, redo_value)
-        finally:
-            self._during_ur_op = False
+        with self._write_lock:
+            # 現在の値をUndo履歴に保存
+            try:
+                _, _, current_value = self._resolve_path(state_path)
+                self._undo_stacks[state_path].append(copy.deepcopy(current_value))
+            except (AttributeError, ValueError):
+                return
+
+            # Redo値を取得して適用
+            self._during_ur_op = True  # 再帰防止フラグを設定
+            try:
+                redo_value = redo_stack.pop()
+                result = self._apply_update(state_path, redo_value, False)
+            finally:
+                self._during_ur_op = False
+
+        # 通知はロックを解放してから送信する
+        if result is not None:
+            self._publish_update(state_path, result[0], result[1])
 
         # ステータス通知を送信
         self._emit_ur_status(state_path)
@@ -370,7 +1021,7 @@ class Store(PubSubBase, Generic[TState]):
         """
         undo_stack = self._undo_stacks.get(state_path, [])
         redo_stack = self._redo_stacks.get(state_path, [])
-        self.publish(
+        self._notify(
             f"{DefaultUndoTopic.STATUS_CHANGED}.{state_path}",
             can_undo=len(undo_stack) > 0,
             can_redo=len(redo_stack) > 0,
@@ -388,18 +1039,44 @@ class Store(PubSubBase, Generic[TState]):
             正規化後のパスと自ストア向けかどうかのフラグ。
         """
 
-        segments = state_path.split(".")
+        segments, available = self._normalize_segments(_split_path(state_path))
+        if not available:
+            return "", False
+        return ".".join(segments), True
+
+    def _normalize_segments(
+        self, segments: tuple[str, ...]
+    ) -> tuple[tuple[str, ...], bool]:
+        """分割済みパスのState型名プレフィックスを処理して自ストア向けか判定する。
+
+        Args:
+            segments: 分割済みの状態パス。
+
+        Returns:
+            正規化後のセグメントと自ストア向けかどうかのフラグ。
+        """
+
         if not segments:
-            return "", True
+            return (), True
 
         first = segments[0]
         if first == self._state_class.__name__:
-            return ".".join(segments[1:]), True
+            return segments[1:], True
 
         for cls in _stores.keys():
             if first == cls.__name__ and cls is not self._state_class:
-                return "", False
-        return state_path, True
+                return (), False
+        return segments, True
+
+    def _path_segments(self, state_path: Any) -> tuple[str, ...]:
+        """状態パスを分割済みセグメントに変換する。
+
+        ``StateProxy`` が渡された場合は保持しているセグメントをそのまま使い、
+        文字列の場合はキャッシュ付きで分割する。
+        """
+        if isinstance(state_path, StateProxy):
+            return state_path._segments
+        return _split_path(str(state_path))
 
     def _resolve_path(self, path: str) -> tuple[Any, str, Any]:
         """
@@ -410,12 +1087,21 @@ class Store(PubSubBase, Generic[TState]):
         Returns:
             (対象オブジェクト, 属性名, 現在値)
         """
-        path, available = self._normalize_state_path(path)
+        return self._resolve_segments(_split_path(path))
+
+    def _resolve_segments(self, segments: tuple[str, ...]) -> tuple[Any, str, Any]:
+        """
+        分割済みの属性パスを解決し、対象オブジェクト・属性名・現在値を返す。
+
+        Args:
+            segments: 解析する属性パスのセグメント。
+        Returns:
+            (対象オブジェクト, 属性名, 現在値)
+        """
+        segments, available = self._normalize_segments(segments)
         if not available:
             raise ValueError("Path does not belong to this store")
 
-        segments = path.split(".")
-
         if not segments:
             raise ValueError("Empty path")
 
@@ -425,45 +1111,226 @@ class Store(PubSubBase, Generic[TState]):
         # 最後のセグメント以外のパスをたどって対象オブジェクトを取得
         current = self._state
         for segment in segments[:-1]:
-            if not hasattr(current, segment):
-                raise AttributeError(f"No such attribute: {segment} in path {path}")
+            if not _has_attr(current, segment):
+                raise AttributeError(
+                    f"No such attribute: {segment} in path {'.'.join(segments)}"
+                )
             current = getattr(current, segment)
 
         # 現在の値を取得
-        if not hasattr(current, attr_name):
-            raise AttributeError(f"No such attribute: {attr_name} in path {path}")
+        if not _has_attr(current, attr_name):
+            raise AttributeError(
+                f"No such attribute: {attr_name} in path {'.'.join(segments)}"
+            )
 
         old_value = getattr(current, attr_name)
         return current, attr_name, old_value
 
-    def _validate_and_set_value(
-        self, target_obj: Any, attr_name: str, new_value: Any
-    ) -> None:
-        """属性値を型検証してから設定する。
+    def _set_value(self, segments: tuple[str, ...], new_value: Any) -> None:
+        """分割済みパスの値を差し替えた新しい状態ルートに置き換える。
+
+        変更パス上の祖先ノードだけをコピーし、それ以外の部分木は
+        直前の状態と共有する。
+
+        Args:
+            segments: 変更対象の属性パスのセグメント。
+            new_value: 新しい値。
+        """
+        segments, _ = self._normalize_segments(segments)
+        setter = self._setters.get(segments, _NOT_COMPILED)
+        if setter is _NOT_COMPILED:
+            setter = self._setters[segments] = self._compile_setter(segments)
+        if setter is None:
+            self._state = self._rebuild(self._state, segments, new_value)
+        else:
+            self._state = setter(self._state, new_value)
+
+    def _compile_setter(
+        self, segments: tuple[str, ...]
+    ) -> Callable[[Any, Any], Any] | None:
+        """パス専用の差し替え関数を作成する。
+
+        パスがモデルのスキーマ上のフィールドだけで構成される場合に、型の解決と
+        末端フィールドの検証方法の検索を一度だけ行った関数を返す。
+        それ以外（辞書や任意オブジェクトを経由するパス）は ``None`` を返し、
+        汎用の ``_rebuild`` で処理する。
+
+        Args:
+            segments: 正規化済みのパスのセグメント。
+        Returns:
+            ``(旧ルート, 新しい値) -> 新ルート`` の関数、または ``None``。
+        """
+        if not segments:
+            return None
+
+        model: Type[BaseModel] | None = self._state_class
+        for segment in segments[:-1]:
+            field_info = model.model_fields.get(segment)
+            if field_info is None:
+                return None
+            model = _model_type(field_info.annotation)
+            if model is None:
+                return None
+
+        plan = _field_plans(model).get(segments[-1])
+        if plan is None:
+            return None
+
+        field_type, validate = plan
+        parents = segments[:-1]
+        attrs = segments[::-1]
+        rebuild = self._rebuild
+
+        def setter(root: Any, value: Any) -> Any:
+            nodes = [root]
+            node = root
+            for attr in parents:
+                node = getattr(node, attr)
+                nodes.append(node)
+
+            if not all(isinstance(n, BaseModel) for n in nodes):
+                # スキーマと異なる値（検証されずに入った辞書など）を経由する場合
+                return rebuild(root, segments, value)
+
+            if not (field_type is not None and isinstance(value, field_type)):
+                if validate is not None and hasattr(value, "model_dump"):
+                    value = validate(value)
+
+            nodes.reverse()
+            value = _copy_with(nodes[0], {attrs[0]: value})
+            for node, attr in zip(nodes[1:], attrs[1:]):
+                value = node.model_copy(update={attr: value})
+            return value
+
+        return setter
+
+    def _set_values(self, updates: dict[tuple[str, ...], Any]) -> None:
+        """正規化済みの複数パスの値をまとめて差し替える。
+
+        共通の祖先ノードは 1 回だけ作り直す。あるパスが別のパスの祖先に
+        当たる場合は適用順が意味を持つため、1 件ずつ順に差し替える。
+
+        Args:
+            updates: 正規化済みセグメントと新しい値の対応。
+        """
+        if not updates:
+            return
+        if any(
+            segments[:i] in updates
+            for segments in updates
+            for i in range(1, len(segments))
+        ):
+            for segments, new_value in updates.items():
+                self._state = self._rebuild(self._state, segments, new_value)
+            return
+        self._state = self._rebuild_many(self._state, updates)
+
+    def _rebuild(self, node: Any, segments: tuple[str, ...], new_value: Any) -> Any:
+        """``segments`` の先の値を差し替えた ``node`` のコピーを返す。
+
+        Args:
+            node: 作り直す対象のノード。
+            segments: ``node`` から見た属性パスのセグメント。
+            new_value: 末端に設定する値。
+        Returns:
+            差し替え後の新しいノード。
+        """
+        attr_name = segments[0]
+        if len(segments) == 1:
+            child = self._validate_value(node, attr_name, new_value)
+        else:
+            child = self._rebuild(getattr(node, attr_name), segments[1:], new_value)
+
+        if isinstance(node, BaseModel):
+            if len(segments) == 1:
+                return _copy_with(node, {attr_name: child})
+            return node.model_copy(update={attr_name: child})
+
+        # Pydantic 以外のオブジェクトは浅いコピーに属性を設定する
+        new_node = copy.copy(node)
+        setattr(new_node, attr_name, child)
+        return new_node
+
+    def _rebuild_many(self, node: Any, updates: dict[tuple[str, ...], Any]) -> Any:
+        """複数パスの値を差し替えた ``node`` のコピーを返す。
+
+        Args:
+            node: 作り直す対象のノード。
+            updates: ``node`` から見たセグメントと新しい値の対応（互いに祖先関係なし）。
+        Returns:
+            差し替え後の新しいノード。
+        """
+        assigned: dict[str, Any] = {}
+        rebuilt: dict[str, Any] = {}
+        grouped: dict[str, dict[tuple[str, ...], Any]] = {}
+        for segments, new_value in updates.items():
+            attr_name = segments[0]
+            if len(segments) == 1:
+                assigned[attr_name] = self._validate_value(node, attr_name, new_value)
+            else:
+                grouped.setdefault(attr_name, {})[segments[1:]] = new_value
+
+        for attr_name, sub_updates in grouped.items():
+            rebuilt[attr_name] = self._rebuild_many(
+                getattr(node, attr_name), sub_updates
+            )
+
+        if isinstance(node, BaseModel):
+            return _copy_with(node, assigned, rebuilt)
+
+        new_node = copy.copy(node)
+        for attr_name, child in {**rebuilt, **assigned}.items():
+            setattr(new_node, attr_name, child)
+        return new_node
+
+    def _validate_value(self, target_obj: Any, attr_name: str, new_value: Any) -> Any:
+        """属性に設定する値を型検証して返す。
 
         Args:
             target_obj: 値を設定する対象オブジェクト。
             attr_name: 設定する属性名。
             new_value: 新しい値。
+        Returns:
+            検証済みの値。
         """
         # Pydanticモデルの場合、フィールドの型情報を取得
         if isinstance(target_obj, BaseModel):
-            model_fields = target_obj.__class__.model_fields
+            plan = _field_plans(type(target_obj)).get(attr_name)
+
+            if plan is not None:
+                field_type, validate = plan
 
-            if attr_name in model_fields:
-                field_info = model_fields[attr_name]
+                # 既に宣言どおりの型のインスタンスなら検証不要
+                if field_type is not None and isinstance(new_value, field_type):
+                    return new_value
 
                 # もし新しい値がPydanticモデルの場合、model_validateを使用
-                if hasattr(new_value, "model_dump") and hasattr(
-                    field_info.annotation, "model_validate"
-                ):
-                    field_type = field_info.annotation
-                    validated_value = field_type.model_validate(new_value)
-                    setattr(target_obj, attr_name, validated_value)
-                    return
+                if validate is not None and hasattr(new_value, "model_dump"):
+                    return validate(new_value)
 
         # 通常の属性設定
-        setattr(target_obj, attr_name, new_value)
+        return new_value
+
+    @staticmethod
+    def _construct_trusted(target_obj: Any, attr_name: str, new_value: Any) -> Any:
+        """信頼済みの辞書をモデル型フィールド向けに検証なしでモデル化する。
+
+        Args:
+            target_obj: 値を設定する対象オブジェクト。
+            attr_name: 設定する属性名。
+            new_value: 新しい値。
+        Returns:
+            ``model_construct`` で作成したモデル。対象外の場合は ``new_value``。
+        """
+        if not isinstance(new_value, dict) or not isinstance(target_obj, BaseModel):
+            return new_value
+        field_info = type(target_obj).model_fields.get(attr_name)
+        if field_info is None:
+            return new_value
+        model_cls = _model_type(field_info.annotation)
+        if model_cls is None:
+            return new_value
+        return model_cls.model_construct(**new_value)
 
 
 # State 型ごとに生成した Store を保持する辞書
@@ -3,10 +3,39 @@
 
 外部に公開するのは `story` デコレータと
 `StorybookApplication` の 2 つだけに絞る。
+
+各シンボルは初回アクセス時に読み込む（PEP 562）。ストーリー定義側が
+`story` だけを使う場合に、アプリ本体や Pydantic モデルの構築を避けられる。
 """
 
-from .app import StorybookApplication
-from .core.context import StoryContext
-from .core.decorator import story
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .app import StorybookApplication
+    from .core.context import StoryContext
+    from .core.decorator import story
+
+# 公開名 -> 定義モジュール
+_LAZY_ATTRS = {
+    "StorybookApplication": ".app",
+    "StoryContext": ".core.context",
+    "story": ".core.decorator",
+}
 
 __all__ = ["story", "StorybookApplication", "StoryContext"]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
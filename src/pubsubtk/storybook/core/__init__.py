@@ -1,16 +1,47 @@
 # storybook/core/__init__.py
-"""ストーリー定義・実行の基盤モジュール"""
+"""ストーリー定義・実行の基盤モジュール
 
-from .meta import StoryMeta
-from .context import StoryContext
-from .decorator import story
-from .registry import StoryRegistry
-from .state import StorybookState
+各シンボルは初回アクセス時に読み込む（PEP 562）。
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .context import StoryContext
+    from .decorator import story
+    from .meta import StoryMeta
+    from .registry import StoryRegistry
+    from .state import StorybookState
+
+# 公開名 -> 定義モジュール
+_LAZY_ATTRS = {
+    "StoryMeta": ".meta",
+    "StoryContext": ".context",
+    "story": ".decorator",
+    "StoryRegistry": ".registry",
+    "StorybookState": ".state",
+}
 
 __all__ = [
     "StoryMeta",
-    "StoryContext", 
+    "StoryContext",
     "story",
     "StoryRegistry",
-    "StorybookState"
-]
\ No newline at end of file
+    "StorybookState",
+]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
@@ -10,6 +10,12 @@ from pathlib import Path
 from types import ModuleType
 from typing import Iterable, List
 
+# 探索対象から除外するディレクトリ名
+_IGNORED_PARTS = frozenset(("tests", "__pycache__", ".venv"))
+
+# ファイルパス -> ((mtime_ns, size), 判定結果)
+_scan_cache: dict[Path, tuple[tuple[int, int], bool]] = {}
+
 
 def _contains_story_decorator(py_file: Path) -> bool:
     """.py ファイルに `@story` デコレータがあるか静的解析で判定する。
@@ -20,14 +26,37 @@ def _contains_story_decorator(py_file: Path) -> bool:
         True なら story デコレータが登場する
     """
     try:
-        source = py_file.read_text(encoding="utf-8")
-    except (OSError, UnicodeDecodeError):
+        stat = py_file.stat()
+    except OSError:
+        return False
+
+    # 前回から変更のないファイルは判定結果を再利用
+    cache_key = (stat.st_mtime_ns, stat.st_size)
+    cached = _scan_cache.get(py_file)
+    if cached is not None and cached[0] == cache_key:
+        return cached[1]
+
+    result = _scan_story_decorator(py_file)
+    _scan_cache[py_file] = (cache_key, result)
+    return result
+
+
+def _scan_story_decorator(py_file: Path) -> bool:
+    """ファイル内容を読み、`@story` デコレータの有無を判定する。"""
+    try:
+        data = py_file.read_bytes()
+    except OSError:
+        return False
+
+    # "story" を含まないファイルは構文解析するまでもない
+    if b"story" not in data:
         return False
 
     try:
+        source = data.decode("utf-8")
         tree = ast.parse(source, filename=str(py_file))
-    except SyntaxError:
-        # 不完全なファイルはスキップ
+    except (UnicodeDecodeError, SyntaxError, ValueError):
+        # デコードできない・不完全なファイルはスキップ
         return False
 
     for node in ast.walk(tree):
@@ -75,7 +104,7 @@ def discover_stories(src_dir: str | Path = "src") -> List[ModuleType]:
 
     for py_file in py_files:
         # 無視したいパスはここで continue
-        if any(part in ("tests", "__pycache__", ".venv") for part in py_file.parts):
+        if not _IGNORED_PARTS.isdisjoint(py_file.parts):
             continue
         if not _contains_story_decorator(py_file):
             continue
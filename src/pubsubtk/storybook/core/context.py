@@ -4,24 +4,48 @@
 from __future__ import annotations
 
 import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
 from typing import Any, Callable, Dict, List, Optional, Type
 
-from pydantic import BaseModel
-
 from ..knobs.store import get_knob_store
-from ..knobs.types import KnobSpec, KnobValue
+from ..knobs.types import KnobValue, make_spec
 
 
-class StoryContext(BaseModel):
-    """ストーリー実行時に渡されるコンテキスト"""
+# 完了確認のポーリング間隔（ミリ秒）
+_POLL_INTERVAL_MS = 16
 
-    parent: tk.Widget
-    _publish_callback: Callable[[str, dict], None] | None = None
-    _knob_values: Dict[str, KnobValue] = {}
-    _story_id: Optional[str] = None
+_executor: ThreadPoolExecutor | None = None
+
+
+def _story_executor() -> ThreadPoolExecutor:
+    """ストーリーのバックグラウンド処理用の共有スレッドプールを返す。"""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="storybook")
+    return _executor
 
-    class Config:
-        arbitrary_types_allowed = True
+
+@dataclass(slots=True)
+class StoryContext:
+    """ストーリー実行時に渡されるコンテキスト
+
+    値の検証は不要なため Pydantic モデルではなく ``__slots__`` 付きの
+    dataclass とし、ストーリー切り替えごとの生成コストを抑える。
+    """
+
+    parent: tk.Widget
+    _publish_callback: Callable[[str, dict], None] | None = field(
+        default=None, init=False, repr=False
+    )
+    _knob_values: Dict[str, KnobValue] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _story_id: Optional[str] = field(default=None, init=False)
+    _updater: Optional[Callable[[], None]] = field(
+        default=None, init=False, repr=False
+    )
 
     def set_publish_callback(self, callback: Callable[[str, dict], None]) -> None:
         """PubSub発行用のコールバックを設定"""
@@ -52,13 +76,13 @@ class StoryContext(BaseModel):
             self._knob_values[name] = existing_knob
             return existing_knob
 
-        # 新しいKnobSpec作成
-        spec = KnobSpec(
-            name=name,
-            type=type_,
-            default=default,
+        # KnobSpec作成（同じ宣言なら作成済みの仕様を再利用）
+        spec = make_spec(
+            name,
+            type_,
+            default,
             desc=desc,
-            range=range_,
+            range_=range_,
             choices=choices,
             multiline=multiline,
         )
@@ -67,12 +91,10 @@ class StoryContext(BaseModel):
         saved_value = store.get_value(story_id, name, default)
 
         # KnobValue作成
-        knob_value = KnobValue(spec, saved_value)
+        knob_value = KnobValue(spec, saved_value, story_id=story_id)
 
         # 値変更時のコールバックを追加（グローバルストアに保存）
-        knob_value.add_change_callback(
-            lambda value: store.set_value(story_id, name, value)
-        )
+        knob_value.add_change_callback(partial(store.set_value, story_id, name))
 
         # ローカルおよびグローバルストアに保存
         self._knob_values[name] = knob_value
@@ -80,6 +102,32 @@ class StoryContext(BaseModel):
 
         return knob_value
 
+    def set_updater(self, updater: Callable[[], None]) -> None:
+        """Knob 変更時にウィジェットを作り直さずに更新する関数を登録する。
+
+        登録すると、Knob の値が変わってもストーリーの factory は再実行されず、
+        ``updater`` だけが呼ばれる（各 KnobValue の ``value`` は更新済み）。
+        登録しない場合は従来どおりストーリー全体を再描画する。
+
+        使用例:
+            lbl = tk.Label(ctx.parent, text=text.value)
+            ctx.set_updater(lambda: lbl.configure(text=text.value))
+            return lbl
+        """
+        self._updater = updater
+
+    def apply_knob_changes(self) -> bool:
+        """登録済みの updater で Knob の変更を反映する。
+
+        Returns:
+            反映できた場合は ``True``。updater が未登録なら ``False``
+            （呼び出し側でストーリーを再描画する）。
+        """
+        if self._updater is None:
+            return False
+        self._updater()
+        return True
+
     @property
     def knob_values(self) -> Dict[str, KnobValue]:
         """登録済みKnobValue一覧"""
@@ -95,9 +143,58 @@ class StoryContext(BaseModel):
             self._publish_callback(f"storybook.{topic}", kwargs)
 
     def on_change(self, var: tk.Variable, cb: Callable[[Any], None]) -> None:
-        """tk.Variable にトレーサを張って変更をフック。"""
+        """tk.Variable にトレーサを張って変更をフック。
+
+        キー入力などで書き込みが連続しても、コールバックはアイドル時に
+        最新値で 1 回だけ呼び出す。
+        """
+        scheduled = False
+
+        def _flush():
+            nonlocal scheduled
+            scheduled = False
+            try:
+                value = var.get()
+            except tk.TclError:
+                # 変数が破棄済み（ストーリー切り替え後など）
+                return
+            cb(value)
 
         def _update(*_):
-            cb(var.get())
+            nonlocal scheduled
+            if scheduled:
+                return
+            scheduled = True
+            self.parent.after_idle(_flush)
 
         var.trace_add("write", _update)
+
+    def run_in_background(
+        self, work: Callable[..., Any], on_done: Callable[[Any], None], *args: Any
+    ) -> Future:
+        """重い前処理をワーカースレッドで実行し、結果をメインスレッドで受け取る。
+
+        ``work`` はウィジェットに触れない処理（データ取得や計算）に限ること。
+        ``on_done`` は Tk のメインスレッドで ``work`` の戻り値を引数に呼ばれる。
+        完了前にストーリーが切り替わって ``parent`` が破棄された場合は呼ばれない。
+
+        Args:
+            work: バックグラウンドで実行する関数。
+            on_done: 完了時にメインスレッドで呼ぶコールバック。
+            *args: ``work`` に渡す引数。
+        Returns:
+            ``work`` の実行を表す Future。
+        """
+        future = _story_executor().submit(work, *args)
+        parent = self.parent
+
+        def _poll():
+            if not future.done():
+                parent.after(_POLL_INTERVAL_MS, _poll)
+                return
+            if future.cancelled() or not parent.winfo_exists():
+                return
+            on_done(future.result())
+
+        parent.after(_POLL_INTERVAL_MS, _poll)
+        return future
@@ -4,14 +4,20 @@
 from __future__ import annotations
 
 import re
+import sys
+from functools import lru_cache
 from typing import Callable
 
 from .meta import StoryMeta
 from .registry import StoryRegistry
 
 
+_SLUG_INVALID = re.compile(r"[^a-z0-9_]")
+
+
+@lru_cache(maxsize=None)
 def _slugify(text: str) -> str:
-    return re.sub(r"[^a-z0-9_]", "_", text.lower())
+    return _SLUG_INVALID.sub("_", text.lower())
 
 
 def story(path: str | None = None, title: str | None = None):
@@ -28,12 +34,13 @@ def story(path: str | None = None, title: str | None = None):
         default_path = f"{comp_name}.{factory.__name__}"
 
         full_path = (path or default_path).strip(".")
-        segments = full_path.split(".")
+        # 階層名は多くのストーリーで共有されるため intern して同一オブジェクトにする
+        segments = [sys.intern(seg) for seg in full_path.split(".")]
         leaf_title = title or segments[-1]
 
         meta = StoryMeta(
             id=_slugify(full_path),
-            path=segments[:-1],
+            path=tuple(segments[:-1]),
             title=leaf_title,
             factory=factory,
         )
@@ -4,18 +4,27 @@
 from __future__ import annotations
 
 import tkinter as tk
-from typing import Callable, List
+from functools import cached_property
+from typing import Callable, Tuple
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class StoryMeta(BaseModel):
     """Story のメタ情報"""
 
+    # 登録後に書き換えないため frozen とする
+    # （スキーマ構築は初回インスタンス化まで遅延）
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True, frozen=True, defer_build=True
+    )
+
     id: str
-    path: List[str]  # ["Button", "Primary"]
+    path: Tuple[str, ...]  # ("Button", "Primary")
     title: str  # "Primary"
     factory: Callable[..., tk.Widget]
 
-    class Config:
-        arbitrary_types_allowed = True
+    @cached_property
+    def breadcrumb(self) -> str:
+        """プレビューのヘッダーに表示する階層表記（例: ``"Button > Primary"``）"""
+        return " > ".join((*self.path, self.title))
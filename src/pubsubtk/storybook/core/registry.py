@@ -3,25 +3,83 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import Dict, List, Optional, Tuple, Union
 
 from pubsubtk.storybook.core.meta import StoryMeta
 
 
+class StoryTreeNode:
+    """ストーリー階層（フォルダ）を表すトライのノード"""
+
+    __slots__ = ("name", "dotted", "children", "entries")
+
+    def __init__(self, name: str = "", dotted: str = ""):
+        self.name = name
+        # ルートからのドット区切りパス（Treeview の iid に使用）
+        self.dotted = dotted
+        # セグメント -> 子フォルダ（検索用）
+        self.children: Dict[str, StoryTreeNode] = {}
+        # 子フォルダとストーリーを登録順に保持（表示用）
+        self.entries: List[Union[StoryTreeNode, StoryMeta]] = []
+
+    def child(self, name: str) -> StoryTreeNode:
+        """子フォルダを返す。存在しなければ作成する。"""
+        node = self.children.get(name)
+        if node is None:
+            dotted = f"{self.dotted}.{name}" if self.dotted else name
+            node = self.children[name] = StoryTreeNode(name, dotted)
+            self.entries.append(node)
+        return node
+
+
 class StoryRegistry:
     """ストーリーメタを管理するレジストリ"""
 
     _stories: List[StoryMeta] = []
+    # list() が返す不変スナップショット（登録・クリア時に破棄）
+    _snapshot: Optional[Tuple[StoryMeta, ...]] = None
+    # {story_id: StoryMeta}（by_id() が作成し、登録・クリア時に破棄）
+    _by_id_cache: Optional[Dict[str, StoryMeta]] = None
+    _root: StoryTreeNode = StoryTreeNode()
 
     @classmethod
     def register(cls, meta: StoryMeta) -> None:
+        cls._snapshot = None
+        cls._by_id_cache = None
         cls._stories.append(meta)
 
+        node = cls._root
+        for seg in meta.path:
+            node = node.child(seg)
+        node.entries.append(meta)
+
+    @classmethod
+    def list(cls) -> Tuple[StoryMeta, ...]:
+        """登録済みストーリーを登録順に返す（呼び出しごとにコピーしない）"""
+        snapshot = cls._snapshot
+        if snapshot is None:
+            snapshot = cls._snapshot = tuple(cls._stories)
+        return snapshot
+
+    @classmethod
+    def by_id(cls) -> Dict[str, StoryMeta]:
+        """ストーリー ID からメタ情報を引く辞書を返す（ID が重複する場合は先勝ち）"""
+        cache = cls._by_id_cache
+        if cache is None:
+            cache = cls._by_id_cache = {}
+            for meta in cls._stories:
+                cache.setdefault(meta.id, meta)
+        return cache
+
     @classmethod
-    def list(cls) -> List[StoryMeta]:
-        return cls._stories.copy()
+    def tree(cls) -> StoryTreeNode:
+        """登録済みストーリーの階層ツリー（ルートノード）を返す。"""
+        return cls._root
 
     @classmethod
     def clear(cls) -> None:
         """テスト用などでレジストリをクリア"""
         cls._stories.clear()
+        cls._snapshot = None
+        cls._by_id_cache = None
+        cls._root = StoryTreeNode()
@@ -3,12 +3,14 @@
 
 from typing import Any, Dict, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class StorybookState(BaseModel):
     """Storybook の状態を一元管理するモデル"""
 
+    model_config = ConfigDict(defer_build=True)
+
     active_story_id: Optional[str] = None
     layout_mode: str = "normal"  # "normal" or "fullscreen"
     knob_values: Dict[str, Any] = {}  # Knob値の保存（ストーリー間で共有）
@@ -1,16 +1,38 @@
 # storybook/knob/knob_controls.py
 """個別のKnob UI制御ウィジェット"""
 
+import time
 import tkinter as tk
 from tkinter import ttk
 from typing import Any, Callable
 
+from .scheduler import get_flush_scheduler
+from .store import get_knob_store
 from .types import KnobValue
 
+# 直近のストーリー再描画にかかった時間（ミリ秒）。スライダー操作中の通知間隔に使う
+_LAST_REBUILD_MS: float = 16.0
+
+
+def set_rebuild_time(ms: float) -> None:
+    """直近のストーリー再描画時間を記録する（スライダー通知の間引き用）"""
+    global _LAST_REBUILD_MS
+    _LAST_REBUILD_MS = max(float(ms), 1.0)
+
 
 class KnobControlBase:
     """Knob制御ウィジェットの基底クラス"""
 
+    __slots__ = (
+        "parent",
+        "knob_value",
+        "on_change",
+        "frame",
+        "var",
+        "_traces",
+        "_suppress_trace",
+    )
+
     def __init__(
         self, parent: tk.Widget, knob_value: KnobValue, on_change: Callable[[Any], None]
     ):
@@ -18,7 +40,11 @@ class KnobControlBase:
         self.knob_value = knob_value
         self.on_change = on_change
         self.frame = ttk.Frame(parent)
+        self._traces: list[tuple[tk.Variable, str]] = []
+        self._suppress_trace = False  # 値の差し替え中は変更通知を出さない
         self._setup_ui()
+        # 変数は使い回すため、破棄時にトレースを外してプールへ返す
+        self.frame.bind("<Destroy>", self._on_destroy, add="+")
 
     def _setup_ui(self):
         """UIセットアップ（サブクラスで実装）"""
@@ -28,13 +54,82 @@ class KnobControlBase:
         """フレームをpack"""
         self.frame.pack(**kwargs)
 
+    def set_knob_value(self, knob_value: KnobValue):
+        """対象の KnobValue を差し替え、表示値を更新する（変更通知は出さない）
+
+        差し替え前の Knob に予約されていた変更通知は取り消す。
+        """
+        self.commit_input()
+        get_flush_scheduler().cancel(self.knob_value.key)
+        self.knob_value = knob_value
+        self.refresh_value()
+
+    def refresh_value(self):
+        """KnobValue の現在値を表示に反映する（変更通知は出さない）"""
+        self._suppress_trace = True
+        try:
+            self._apply_value(self.knob_value.value)
+        finally:
+            self._suppress_trace = False
+
+    def commit_input(self):
+        """未送信の入力を通知せずに KnobValue へ反映する
+
+        破棄や KnobValue の差し替えの直前に呼び、デバウンス中の入力が
+        失われないようにする。入力時に値を反映するコントロールでは何もしない。
+        """
+
+    def _apply_value(self, value: Any):
+        """表示値を更新（サブクラスで実装）"""
+        self.var.set(str(value))
+
+    def _set_quietly(self, var: tk.Variable, value: Any):
+        """変更通知を出さずに変数へ書き込む（連動する変数同士の反響を防ぐ）"""
+        suppressed, self._suppress_trace = self._suppress_trace, True
+        try:
+            var.set(value)
+        finally:
+            self._suppress_trace = suppressed
+
+    def _bind_var(
+        self, var_type: type, initial: Any, callback: Callable
+    ) -> tk.Variable:
+        """プールから変数を取得し、書き込みトレースを登録する"""
+        var = get_knob_store().acquire_var(var_type, initial)
+        self._traces.append((var, var.trace_add("write", callback)))
+        return var
+
+    def _on_destroy(self, event=None):
+        """破棄時に未送信の通知とトレースを片付け、変数をプールへ返す"""
+        self.commit_input()
+        get_flush_scheduler().cancel(self.knob_value.key)
+        variables = [var for var, _ in self._traces]
+        self._remove_traces()
+        store = get_knob_store()
+        for var in variables:
+            store.release_var(var)
+
+    def _flush_now(self, event=None):
+        """確定操作（Enter / フォーカス移動）時に未送信の変更をすぐ送る"""
+        get_flush_scheduler().flush(self.knob_value.key)
+
+    def _remove_traces(self):
+        """登録したトレースを解除"""
+        traces, self._traces = self._traces, []
+        for var, trace_id in traces:
+            try:
+                var.trace_remove("write", trace_id)
+            except tk.TclError:
+                pass
+
 
 class TextKnobControl(KnobControlBase):
     """テキスト入力Knob"""
 
+    __slots__ = ("widget", "_debounce_delay")
+
     def __init__(self, parent, knob_value, on_change):
         super().__init__(parent, knob_value, on_change)
-        self._debounce_timer = None
         self._debounce_delay = 300  # 300ms
 
     def _setup_ui(self):
@@ -49,50 +144,102 @@ class TextKnobControl(KnobControlBase):
         if spec.multiline:
             self.widget = tk.Text(self.frame, height=3, width=30)
             self.widget.insert("1.0", str(self.knob_value.value))
-            self.widget.bind("<KeyRelease>", self._on_text_change)
+            self.widget.edit_modified(False)
+            # 内容が変わったときだけ通知する（カーソル移動などのキーでは発火しない）
+            self.widget.bind("<<Modified>>", self._on_text_change)
         else:
-            self.var = tk.StringVar(value=str(self.knob_value.value))
+            self.var = self._bind_var(
+                tk.StringVar, str(self.knob_value.value), self._on_var_change
+            )
             self.widget = ttk.Entry(self.frame, textvariable=self.var, width=30)
-            self.var.trace_add("write", self._on_var_change)
+            self.widget.bind("<Return>", self._flush_now)
+            self.widget.bind("<FocusOut>", self._flush_now)
 
         self.widget.pack(side="left", fill="x", expand=True)
 
+    def _apply_value(self, value: Any):
+        if self.knob_value.spec.multiline:
+            self.widget.delete("1.0", "end")
+            self.widget.insert("1.0", str(value))
+            # プログラムからの書き換えは変更通知の対象外
+            self.widget.edit_modified(False)
+        else:
+            self.var.set(str(value))
+
     def _on_var_change(self, *args):
         """変数変更時（デバウンス付き）"""
-        new_value = self.var.get()
-        self.knob_value.value = new_value
-
-        # 既存のタイマーをキャンセル
-        if self._debounce_timer:
-            self.frame.after_cancel(self._debounce_timer)
-
-        # 新しいタイマーを設定
-        self._debounce_timer = self.frame.after(
-            self._debounce_delay, lambda: self.on_change(new_value)
-        )
+        if self._suppress_trace:
+            return
+        self._schedule_flush()
 
     def _on_text_change(self, event):
         """テキスト変更時（デバウンス付き）"""
-        new_value = self.widget.get("1.0", "end-1c")
-        self.knob_value.value = new_value
+        if not self.widget.edit_modified():
+            # 変更フラグを戻したことによるイベント
+            return
+        self.widget.edit_modified(False)
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        """値の読み取りと通知をデバウンス後にまとめて行う"""
+        # 入力中は値を読み取らず、送信時に最新の値を読む
+        get_flush_scheduler().schedule(
+            self.knob_value.key, self.frame, self._debounce_delay, self._flush
+        )
 
-        # 既存のタイマーをキャンセル
-        if self._debounce_timer:
-            self.frame.after_cancel(self._debounce_timer)
+    def _read_input(self) -> str:
+        """入力中の値を読み取る"""
+        if self.knob_value.spec.multiline:
+            return self.widget.get("1.0", "end-1c")
+        return self.var.get()
 
-        # 新しいタイマーを設定
-        self._debounce_timer = self.frame.after(
-            self._debounce_delay, lambda: self.on_change(new_value)
-        )
+    def commit_input(self):
+        get_flush_scheduler().cancel(self.knob_value.key)
+        try:
+            new_value = self._read_input()
+        except tk.TclError:
+            return
+        # KnobValue のコールバックで KnobStore にも保存される
+        self.knob_value.value = new_value
+
+    def _flush(self):
+        """入力値を読み取り、KnobValue に反映して通知"""
+        try:
+            new_value = self._read_input()
+        except tk.TclError:
+            # デバウンス中にウィジェットが破棄された
+            return
+        if new_value == self.knob_value.value:
+            # 入力し直して元の値に戻った場合などは再描画しない
+            return
+        self.knob_value.value = new_value
+        self.on_change(new_value)
 
 
 class NumberKnobControl(KnobControlBase):
     """数値入力Knob（スライダー付き）"""
 
+    __slots__ = (
+        "has_scale",
+        "_cast",
+        "scale",
+        "scale_var",
+        "_is_sliding",
+        "_pending_value",
+        "_last_emit",
+    )
+
     def __init__(self, parent, knob_value, on_change):
+        # スライダーの有無は仕様で決まるため、UI 作成前に確定させておく
+        self.has_scale = bool(knob_value.spec.range_)
+        # 入力値の変換関数（int / float）。イベントごとに spec をたどらない
+        self._cast = knob_value.spec.type_
+        self.scale = None
+        self.scale_var = None
         super().__init__(parent, knob_value, on_change)
         self._is_sliding = False  # スライダー操作中フラグ
         self._pending_value = None  # 保留中の値
+        self._last_emit = 0.0  # 直近に通知した時刻（秒）
 
     def _setup_ui(self):
         spec = self.knob_value.spec
@@ -103,18 +250,23 @@ class NumberKnobControl(KnobControlBase):
         )
 
         # 数値入力
-        self.var = tk.StringVar(value=str(self.knob_value.value))
+        # エントリー変更時のハンドラー（デバウンス付き）
+        self.var = self._bind_var(
+            tk.StringVar, str(self.knob_value.value), self._on_entry_change
+        )
         entry = ttk.Entry(self.frame, textvariable=self.var, width=8)
         entry.pack(side="left", padx=(0, 5))
-
-        # エントリー変更時のハンドラー（デバウンス付き）
-        self._entry_timer = None
-        self.var.trace_add("write", self._on_entry_change)
+        entry.bind("<Return>", self._flush_now)
+        entry.bind("<FocusOut>", self._flush_now)
 
         # スライダー（range指定時）
-        if spec.range_:
+        if self.has_scale:
             from_, to = spec.range_
-            self.scale_var = tk.DoubleVar(value=float(self.knob_value.value))
+            self.scale_var = self._bind_var(
+                tk.DoubleVar,
+                float(self.knob_value.value),
+                self._on_scale_change,
+            )
             self.scale = ttk.Scale(
                 self.frame,
                 from_=from_,
@@ -128,29 +280,31 @@ class NumberKnobControl(KnobControlBase):
             # スライダーのイベントバインディング
             self.scale.bind("<ButtonPress-1>", self._on_scale_press)
             self.scale.bind("<ButtonRelease-1>", self._on_scale_release)
-            self.scale_var.trace_add("write", self._on_scale_change)
+
+    def _apply_value(self, value: Any):
+        self.var.set(str(value))
+        if self.has_scale:
+            self.scale_var.set(float(value))
 
     def _on_entry_change(self, *args):
         """入力フィールド変更時（デバウンス付き）"""
+        if self._suppress_trace:
+            return
         # スライダー操作中は無視
-        if hasattr(self, "scale") and self._is_sliding:
+        if self.has_scale and self._is_sliding:
             return
 
         try:
-            new_value = self.knob_value.spec.type_(self.var.get())
+            new_value = self._cast(self.var.get())
             self.knob_value.value = new_value
 
-            # スライダーがある場合は値を同期
-            if hasattr(self, "scale_var"):
-                self.scale_var.set(float(new_value))
-
-            # デバウンス処理
-            if self._entry_timer:
-                self.frame.after_cancel(self._entry_timer)
+            # スライダーがある場合は値を同期（スライダー側の通知は出さない）
+            if self.has_scale:
+                self._set_quietly(self.scale_var, float(new_value))
 
-            self._entry_timer = self.frame.after(
-                300,  # 300ms delay
-                lambda: self.on_change(new_value),
+            # デバウンス処理（300ms）
+            get_flush_scheduler().schedule(
+                self.knob_value.key, self.frame, 300, self.on_change, new_value
             )
         except (ValueError, TypeError):
             pass
@@ -162,28 +316,63 @@ class NumberKnobControl(KnobControlBase):
     def _on_scale_release(self, event):
         """スライダーのマウスリリース時"""
         self._is_sliding = False
-        # 保留中の値があれば更新を実行
-        if self._pending_value is not None:
-            self.on_change(self._pending_value)
-            self._pending_value = None
+        # 保留中の値があれば最終値として更新を実行
+        self._flush_pending()
 
     def _on_scale_change(self, *args):
         """スライダー変更時"""
-        new_value = self.knob_value.spec.type_(self.scale_var.get())
-        self.var.set(str(new_value))
+        if self._suppress_trace:
+            return
+        new_value = self._cast(self.scale_var.get())
+        if new_value == self.knob_value.value:
+            # 整数の Knob では細かなスライダー移動が同じ値に丸められる
+            return
+        self._set_quietly(self.var, str(new_value))
         self.knob_value.value = new_value
 
-        if self._is_sliding:
-            # スライダー操作中は値を保留
-            self._pending_value = new_value
-        else:
+        if not self._is_sliding:
             # プログラムによる変更（初期化など）は即座に反映
-            self.on_change(new_value)
+            self._emit(new_value)
+            return
+
+        # スライダー操作中は再描画時間に合わせて間引く（最新値のみ保持）
+        interval = _LAST_REBUILD_MS / 1000
+        if time.perf_counter() - self._last_emit >= interval:
+            self._emit(new_value)
+        else:
+            self._pending_value = new_value
+            get_flush_scheduler().schedule(
+                self.knob_value.key,
+                self.frame,
+                int(_LAST_REBUILD_MS),
+                self._flush_pending,
+                restart=False,
+            )
+
+    def commit_input(self):
+        # 入力値は KnobValue へ反映済みのため、予約した通知と保留値だけ捨てる
+        get_flush_scheduler().cancel(self.knob_value.key)
+        self._pending_value = None
+
+    def _flush_pending(self):
+        """保留中のスライダー値を通知する"""
+        get_flush_scheduler().cancel(self.knob_value.key)
+        if self._pending_value is not None:
+            value, self._pending_value = self._pending_value, None
+            self._emit(value)
+
+    def _emit(self, value):
+        """変更を通知し、通知時刻を記録する"""
+        self._pending_value = None
+        self._last_emit = time.perf_counter()
+        self.on_change(value)
 
 
 class BooleanKnobControl(KnobControlBase):
     """ブール値チェックボックス"""
 
+    __slots__ = ()
+
     def __init__(self, parent, knob_value, on_change):
         super().__init__(parent, knob_value, on_change)
 
@@ -191,15 +380,23 @@ class BooleanKnobControl(KnobControlBase):
         spec = self.knob_value.spec
 
         # チェックボックス
-        self.var = tk.BooleanVar(value=self.knob_value.value)
+        # チェックボックスは即座に反映（デバウンス不要）
+        self.var = self._bind_var(
+            tk.BooleanVar, self.knob_value.value, self._on_change_callback
+        )
         checkbox = ttk.Checkbutton(self.frame, text=spec.name, variable=self.var)
         checkbox.pack(side="left", anchor="w")
-        # チェックボックスは即座に反映（デバウンス不要）
-        self.var.trace_add("write", self._on_change_callback)
+
+    def _apply_value(self, value: Any):
+        self.var.set(value)
 
     def _on_change_callback(self, *args):
         """チェックボックス変更時"""
+        if self._suppress_trace:
+            return
         new_value = self.var.get()
+        if new_value == self.knob_value.value:
+            return
         self.knob_value.value = new_value
         self.on_change(new_value)
 
@@ -207,6 +404,8 @@ class BooleanKnobControl(KnobControlBase):
 class SelectKnobControl(KnobControlBase):
     """選択肢ドロップダウン"""
 
+    __slots__ = ()
+
     def __init__(self, parent, knob_value, on_change):
         super().__init__(parent, knob_value, on_change)
 
@@ -219,7 +418,10 @@ class SelectKnobControl(KnobControlBase):
         )
 
         # ドロップダウン
-        self.var = tk.StringVar(value=str(self.knob_value.value))
+        # ドロップダウンは即座に反映
+        self.var = self._bind_var(
+            tk.StringVar, str(self.knob_value.value), self._on_change_callback
+        )
         combo = ttk.Combobox(
             self.frame,
             textvariable=self.var,
@@ -228,27 +430,34 @@ class SelectKnobControl(KnobControlBase):
             width=20,
         )
         combo.pack(side="left", fill="x", expand=True)
-        # ドロップダウンは即座に反映
-        self.var.trace_add("write", self._on_change_callback)
 
     def _on_change_callback(self, *args):
         """ドロップダウン変更時"""
+        if self._suppress_trace:
+            return
         new_value = self.var.get()
+        if new_value == self.knob_value.value:
+            return
         self.knob_value.value = new_value
         self.on_change(new_value)
 
 
+# 値の型 -> コントロールクラス（選択肢付きは型によらず SelectKnobControl）
+_CONTROL_BY_TYPE: dict[type, type[KnobControlBase]] = {
+    bool: BooleanKnobControl,
+    int: NumberKnobControl,
+    float: NumberKnobControl,
+}
+
+
 def create_knob_control(
     parent: tk.Widget, knob_value: KnobValue, on_change: Callable[[Any], None]
 ) -> KnobControlBase:
     """KnobSpecに応じた適切なコントロールを作成"""
     spec = knob_value.spec
 
-    if spec.type_ == bool:
-        return BooleanKnobControl(parent, knob_value, on_change)
-    elif spec.choices:
-        return SelectKnobControl(parent, knob_value, on_change)
-    elif spec.type_ in (int, float):
-        return NumberKnobControl(parent, knob_value, on_change)
-    else:  # str or others
-        return TextKnobControl(parent, knob_value, on_change)
+    # str or others は TextKnobControl
+    cls = _CONTROL_BY_TYPE.get(spec.type_, TextKnobControl)
+    if spec.choices and cls is not BooleanKnobControl:
+        cls = SelectKnobControl
+    return cls(parent, knob_value, on_change)
@@ -2,15 +2,21 @@
 """KnobコントロールパネルのメインUI"""
 
 import tkinter as tk
+from contextlib import contextmanager
+from functools import partial
 from tkinter import ttk
-from typing import Dict
+from typing import Any, Dict, Iterator, List, Tuple
 
 from pubsubtk import ContainerComponentTtk
 
 from ..core.state import StorybookState
-from .controls import create_knob_control
+from .controls import create_knob_control, set_rebuild_time
+from .scheduler import get_flush_scheduler
 from .types import KnobValue
 
+# アイドル 1 回あたりに作成する Knob 行の数
+_ROWS_PER_CHUNK = 8
+
 
 class KnobPanel(ContainerComponentTtk[StorybookState]):
     """Knob制御パネル"""
@@ -19,8 +25,18 @@ class KnobPanel(ContainerComponentTtk[StorybookState]):
         super().__init__(parent=parent, store=store)
         self.knob_controls: Dict[str, any] = {}
         self.knob_values: Dict[str, KnobValue] = {}
+        # hold() 中に保留している Knob 変更 {knob_name: value}
+        self._hold_depth = 0
+        self._pending_changes: Dict[str, Any] = {}
+        # 再構築中でまだ作成していない行と、その作成予約
+        self._pending_rows: List[Tuple[str, KnobValue]] = []
+        self._chunk_after_id = None
+        # {knob_name: 変更コールバック}（再構築をまたいで使い回す）
+        self._change_callbacks: Dict[str, partial] = {}
 
     def setup_ui(self):
+        self._init_styles()
+
         # スクロール可能なフレーム
         self.canvas = tk.Canvas(self, bg="white")
         self.scrollbar = ttk.Scrollbar(
@@ -28,39 +44,173 @@ class KnobPanel(ContainerComponentTtk[StorybookState]):
         )
         self.scrollable_frame = ttk.Frame(self.canvas)
 
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")),
-        )
+        self._scroll_update_pending = False
+        self.scrollable_frame.bind("<Configure>", self._on_frame_configure)
 
         self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
+
+        # 行をまとめる入れ物。再構築時はこのフレームごと破棄する
+        self.content = ttk.Frame(self.scrollable_frame)
+        self.content.pack(fill="both", expand=True)
+        # 空状態のメッセージ（初回表示時に作成し、以降は表示・非表示だけ切り替える）
+        self._empty_frame = None
         self.canvas.configure(yscrollcommand=self.scrollbar.set)
 
         # レイアウト
         self.canvas.pack(side="left", fill="both", expand=True)
         self.scrollbar.pack(side="right", fill="y")
 
+        # マウスホイール（パネル専用のバインドタグをキャンバスとその子孫に付け、
+        # Knob の子ウィジェット上でもスクロールできるようにする。
+        # bind_all と違いアプリ全体のホイール操作には影響しない）
+        self._wheel_accum = 0
+        self._wheel_after = None
+        self._wheel_tag = f"KnobPanelWheel{id(self)}"
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.bind_class(self._wheel_tag, sequence, self._on_mousewheel)
+        self._add_wheel_tag(self.canvas)
+
         # 初期メッセージ
         self._show_empty_message()
 
+    def _init_styles(self):
+        """行ごとに作るラベルの見た目を名前付きスタイルとして登録する
+
+        ウィジェットごとにフォント指定を渡すと、そのたびに Tk がフォントを
+        解決するため、スタイル名で参照させる。
+        """
+        style = ttk.Style(self)
+        style.configure("KnobHeader.TLabel", font=("", 12, "bold"))
+        style.configure("KnobDesc.TLabel", font=("", 8), foreground="gray")
+
+    def _on_frame_configure(self, event):
+        """内部フレームのサイズ変更時にスクロール範囲の更新を予約
+
+        行の追加ごとに発生する Configure をアイドル時の 1 回にまとめる。
+        """
+        if self._scroll_update_pending:
+            return
+        self._scroll_update_pending = True
+        self.after_idle(self._update_scroll_region)
+
+    def _update_scroll_region(self):
+        """スクロール範囲を内部フレームの要求サイズに合わせる"""
+        self._scroll_update_pending = False
+        # キャンバス上の項目は内部フレーム 1 つだけなので bbox("all") は不要
+        self.canvas.configure(
+            scrollregion=(
+                0,
+                0,
+                self.scrollable_frame.winfo_reqwidth(),
+                self.scrollable_frame.winfo_reqheight(),
+            )
+        )
+
+    def _add_wheel_tag(self, widget: tk.Misc) -> None:
+        """ウィジェットとその子孫にホイール用のバインドタグを追加する"""
+        tags = widget.bindtags()
+        if self._wheel_tag not in tags:
+            widget.bindtags(tags + (self._wheel_tag,))
+        for child in widget.winfo_children():
+            self._add_wheel_tag(child)
+
+    def _on_mousewheel(self, event):
+        """ホイール量を積算し、アイドル時に 1 回だけスクロールする"""
+        if event.num == 4:
+            steps = -1
+        elif event.num == 5:
+            steps = 1
+        else:
+            # Windows は 120 単位、macOS は 1 単位で delta が届く
+            steps = -int(event.delta / 120) or (-1 if event.delta > 0 else 1)
+        self._wheel_accum += steps
+        if self._wheel_after is None:
+            self._wheel_after = self.after_idle(self._flush_wheel)
+
+    def _flush_wheel(self):
+        """積算したホイール量でスクロール"""
+        steps, self._wheel_accum = self._wheel_accum, 0
+        self._wheel_after = None
+        if steps:
+            self.canvas.yview_scroll(steps, "units")
+
     def setup_subscriptions(self):
         # PreviewFrameからのKnob情報更新を購読
         self.subscribe("storybook.knobs.update", self._on_knobs_update)
+        # ストーリー再描画時間（スライダー通知の間引き間隔に使用）
+        self.subscribe("storybook.rebuild.time", self._on_rebuild_time)
 
     def refresh_from_state(self):
         pass
 
     def update_knobs(self, knob_values: Dict[str, KnobValue]):
-        """Knobリストを更新"""
+        """Knobリストを更新
+
+        既にコントロールが表示されている場合は差分だけを反映する。
+        同じ名前・同じ仕様の Knob はコントロールを残して値だけを差し替え、
+        なくなった Knob の行だけを破棄し、新しい Knob の行だけを作成する。
+        """
         self.knob_values = knob_values
-        self._rebuild_knob_ui()
+        if not knob_values or not self.knob_controls or self._pending_rows:
+            # 行の作成途中に届いた場合も作り直す
+            self._rebuild_knob_ui()
+            return
+
+        # 不要になった行・仕様が変わった行を破棄
+        for name, control in list(self.knob_controls.items()):
+            knob_value = knob_values.get(name)
+            if knob_value is None:
+                changed = True
+            else:
+                # 仕様は make_spec で共有されるため、通常は同一性比較で決まる
+                old_spec, new_spec = control.knob_value.spec, knob_value.spec
+                changed = old_spec is not new_spec and old_spec != new_spec
+            if changed:
+                control.commit_input()
+                control.parent.destroy()
+                del self.knob_controls[name]
+
+        # 残った行は値だけ差し替え、新しい Knob は行を追加
+        for name, knob_value in knob_values.items():
+            control = self.knob_controls.get(name)
+            if control is None:
+                self._create_knob_row(name, knob_value)
+            elif control.knob_value is not knob_value:
+                control.set_knob_value(knob_value)
+
+        # 表示順が宣言順と異なる場合のみ並べ直す
+        if list(self.knob_controls) != list(knob_values):
+            controls, self.knob_controls = self.knob_controls, {}
+            for name in knob_values:
+                control = controls[name]
+                control.parent.pack_forget()
+                control.parent.pack(fill="x", padx=10, pady=2)
+                self.knob_controls[name] = control
 
     def _rebuild_knob_ui(self):
-        """Knob UIを再構築"""
+        """Knob UIを再構築
+
+        行の作成は数行ずつアイドル時に分けて行い、Knob が多いストーリーでも
+        再構築中に入力イベントを処理できるようにする。
+        """
+        # 作成途中の行があれば破棄
+        if self._chunk_after_id is not None:
+            self.after_cancel(self._chunk_after_id)
+            self._chunk_after_id = None
+        self._pending_rows = []
+
         # 既存のコントロールをクリア
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
+        # 未送信の入力を KnobValue に残してから、入れ物のフレームごと破棄して作り直す
+        # （子孫は Tk 側で一括破棄される）
+        for control in self.knob_controls.values():
+            control.commit_input()
+        self.content.destroy()
+        self.content = ttk.Frame(self.scrollable_frame)
+        self.content.pack(fill="both", expand=True)
+        self._add_wheel_tag(self.content)
         self.knob_controls.clear()
+        if self._empty_frame is not None:
+            self._empty_frame.pack_forget()
 
         if not self.knob_values:
             self._show_empty_message()
@@ -68,58 +218,125 @@ class KnobPanel(ContainerComponentTtk[StorybookState]):
 
         # ヘッダー
         header = ttk.Label(
-            self.scrollable_frame,
+            self.content,
             text="Controls",
-            font=("", 12, "bold"),
+            style="KnobHeader.TLabel",
             padding=(5, 10),
         )
         header.pack(fill="x", padx=10, pady=(5, 10))
 
-        # 各Knobのコントロールを作成
-        for name, knob_value in self.knob_values.items():
+        # 各Knobのコントロールを作成（最初の数行は即座に、残りはアイドル時に）
+        self._pending_rows = list(self.knob_values.items())
+        self._create_row_chunk()
+
+    def _create_row_chunk(self):
+        """保留中の行を最大 _ROWS_PER_CHUNK 行作成し、残りがあれば次を予約"""
+        self._chunk_after_id = None
+        rows = self._pending_rows[:_ROWS_PER_CHUNK]
+        del self._pending_rows[:_ROWS_PER_CHUNK]
+        for name, knob_value in rows:
             self._create_knob_row(name, knob_value)
+        if self._pending_rows:
+            self._chunk_after_id = self.after_idle(self._create_row_chunk)
 
     def _create_knob_row(self, name: str, knob_value: KnobValue):
         """個別のKnobコントロール行を作成"""
         # コンテナフレーム
-        row_frame = ttk.Frame(self.scrollable_frame)
+        row_frame = ttk.Frame(self.content)
         row_frame.pack(fill="x", padx=10, pady=2)
 
         # 説明文（desc指定時）
         if knob_value.spec.desc:
             desc_label = ttk.Label(
-                row_frame, text=knob_value.spec.desc, font=("", 8), foreground="gray"
+                row_frame, text=knob_value.spec.desc, style="KnobDesc.TLabel"
             )
             desc_label.pack(anchor="w", pady=(0, 2))
 
         # コントロール作成
-        control = create_knob_control(
-            row_frame, knob_value, lambda value, n=name: self._on_knob_change(n, value)
-        )
+        callback = self._change_callbacks.get(name)
+        if callback is None:
+            callback = self._change_callbacks[name] = partial(
+                self._on_knob_change, name
+            )
+        control = create_knob_control(row_frame, knob_value, callback)
         control.pack(fill="x", pady=(0, 10))
+        self._add_wheel_tag(row_frame)
 
         self.knob_controls[name] = control
 
+    def set_knob(self, knob_name: str, value: Any) -> None:
+        """Knob の値をプログラムから変更し、表示と変更通知を更新する。
+
+        コントロールの操作と同じ経路で通知するため、``hold()`` 中は
+        通知が保留される。入力途中の未送信の値は破棄される。
+
+        Args:
+            knob_name: 変更する Knob 名。
+            value: 新しい値。
+        Raises:
+            KeyError: 表示中のストーリーに ``knob_name`` の Knob がない場合。
+        """
+        knob = self.knob_values[knob_name]
+        control = self.knob_controls.get(knob_name)
+        if control is not None:
+            get_flush_scheduler().cancel(knob.key)
+        knob.value = value
+        if control is not None:
+            control.refresh_value()
+        self._on_knob_change(knob_name, value)
+
+    @contextmanager
+    def hold(self) -> Iterator[None]:
+        """ブロック内の Knob 変更通知を保留し、終了時に 1 回にまとめて送信する。
+
+        ``set_knob()`` やコントロールの操作で複数の Knob を変更しても
+        ストーリーの再描画は 1 回で済む。同じ Knob への変更は最後の値だけが残る。
+        入れ子で使った場合は最も外側の終了時に送信する。
+
+        使用例:
+            with panel.hold():
+                for name, knob in panel.knob_values.items():
+                    panel.set_knob(name, knob.spec.default)
+        """
+        self._hold_depth += 1
+        try:
+            yield
+        finally:
+            self._hold_depth -= 1
+            if self._hold_depth == 0 and self._pending_changes:
+                changes, self._pending_changes = self._pending_changes, {}
+                self.publish("storybook.knobs.batch_changed", changes=changes)
+
     def _on_knob_change(self, knob_name: str, new_value):
         """Knob値変更時のコールバック"""
+        if self._hold_depth:
+            self._pending_changes[knob_name] = new_value
+            return
+
         # PreviewFrameに変更を通知してストーリーを再描画
         # 注意: knob UI自体は再構築しない（値が保持される）
         self.publish("storybook.knob.changed", knob_name=knob_name, value=new_value)
 
     def _show_empty_message(self):
         """空状態のメッセージ表示"""
-        empty_frame = ttk.Frame(self.scrollable_frame)
-        empty_frame.pack(expand=True, fill="both")
-
-        message_label = ttk.Label(
-            empty_frame,
-            text="No controls available\nSelect a story with knobs",
-            font=("", 10),
-            foreground="gray",
-            justify="center",
-        )
-        message_label.pack(expand=True)
+        if self._empty_frame is None:
+            self._empty_frame = ttk.Frame(self.scrollable_frame)
+
+            message_label = ttk.Label(
+                self._empty_frame,
+                text="No controls available\nSelect a story with knobs",
+                font=("", 10),
+                foreground="gray",
+                justify="center",
+            )
+            message_label.pack(expand=True)
+            self._add_wheel_tag(self._empty_frame)
+        self._empty_frame.pack(expand=True, fill="both")
 
     def _on_knobs_update(self, knob_values: Dict[str, KnobValue]):
         """PreviewFrameからのKnob更新メッセージを受信"""
         self.update_knobs(knob_values)
+
+    def _on_rebuild_time(self, ms: float):
+        """PreviewFrameからの再描画時間を受信"""
+        set_rebuild_time(ms)
@@ -0,0 +1,123 @@
+# storybook/knobs/scheduler.py
+"""Knob変更通知の遅延送信を 1 本のタイマーにまとめるスケジューラ"""
+
+import time
+import tkinter as tk
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+
+class KnobFlushScheduler:
+    """保留中の Knob 通知を Knob ごとに最新の 1 件だけ保持し、まとめて送信する
+
+    Knob はストーリーをまたいで区別できるよう ``KnobValue.key``
+    （``(story_id, Knob 名)``）で識別する。
+
+    コントロールごとに ``after`` / ``after_cancel`` を繰り返す代わりに、
+    プロセス全体で予約するタイマーは常に 1 本だけにする。
+    各通知は送信期限（``time.monotonic`` 基準）を持ち、入力が続く間は
+    期限を延ばすだけでタイマーには触れない。タイマー発火時に期限を
+    過ぎたものだけを送信し、残りがあれば最も早い期限に合わせて予約し直す。
+    """
+
+    def __init__(self):
+        # {knob_key: (deadline, callback, args)}
+        self._pending: Dict[Hashable, Tuple[float, Callable[..., None], tuple]] = {}
+        self._after_id: Optional[str] = None
+        self._timer_owner: Optional[tk.Misc] = None
+        self._due = 0.0  # 予約中タイマーの発火予定時刻（time.monotonic 基準）
+
+    def schedule(
+        self,
+        knob_key: Hashable,
+        widget: tk.Misc,
+        delay_ms: int,
+        callback: Callable[..., None],
+        *args,
+        restart: bool = True,
+    ) -> None:
+        """Knob の通知を予約する（同じ Knob の未送信分は置き換える）
+
+        Args:
+            knob_key: 通知をまとめる単位となる Knob のキー（``KnobValue.key``）。
+            widget: タイマーの予約に使うウィジェット。
+            delay_ms: 送信までの遅延（ミリ秒）。
+            callback: 送信時に呼ぶ関数。
+            *args: ``callback`` に渡す引数。
+            restart: ``False`` の場合、未送信の通知があれば期限を延ばさない
+                （一定間隔での間引きに使う）。
+        """
+        entry = self._pending.get(knob_key)
+        if restart or entry is None:
+            deadline = time.monotonic() + delay_ms / 1000
+        else:
+            deadline = entry[0]
+        self._pending[knob_key] = (deadline, callback, args)
+        self._arm(widget, deadline)
+
+    def _arm(self, widget: tk.Misc, deadline: float) -> None:
+        """期限までにタイマーが発火するよう予約する（予約済みで間に合えば何もしない）"""
+        if self._after_id is not None:
+            if deadline >= self._due:
+                # 予約済みのタイマー発火時に期限を確認する
+                return
+            # より早い送信が必要な場合のみ予約し直す
+            self._timer_owner.after_cancel(self._after_id)
+
+        # コントロールが先に破棄されてもタイマーが消えないよう、トップレベルで予約
+        owner = widget.winfo_toplevel()
+        delay_ms = max(int((deadline - time.monotonic()) * 1000) + 1, 1)
+        self._timer_owner = owner
+        self._due = deadline
+        self._after_id = owner.after(delay_ms, self._on_timer)
+
+    def _on_timer(self) -> None:
+        """期限を過ぎた通知を送信し、残りがあればタイマーを予約し直す"""
+        owner = self._timer_owner
+        self._after_id = None
+        self._timer_owner = None
+
+        now = time.monotonic()
+        due, waiting = [], {}
+        for key, entry in self._pending.items():
+            if entry[0] <= now:
+                due.append(entry)
+            else:
+                waiting[key] = entry
+        # 送信中に予約された通知は次回に回す（辞書ごと差し替えてから送る）
+        self._pending = waiting
+        for _, callback, args in due:
+            callback(*args)
+
+        if self._pending and owner is not None:
+            self._arm(owner, min(entry[0] for entry in self._pending.values()))
+
+    def flush(self, knob_key: Hashable) -> None:
+        """指定した Knob の未送信の通知を期限を待たずに送信する"""
+        entry = self._pending.pop(knob_key, None)
+        if entry is not None:
+            _, callback, args = entry
+            callback(*args)
+
+    def cancel(self, knob_key: Hashable) -> None:
+        """未送信の通知を取り消す"""
+        self._pending.pop(knob_key, None)
+
+    def flush_all(self) -> None:
+        """保留中の通知を期限を待たずにすべて送信する"""
+        if self._after_id is not None:
+            self._timer_owner.after_cancel(self._after_id)
+            self._after_id = None
+            self._timer_owner = None
+        # 送信中に予約された通知は次回に回す（辞書ごと差し替えてから送る）
+        pending, self._pending = self._pending, {}
+        for _, callback, args in pending.values():
+            callback(*args)
+
+
+# グローバルインスタンス
+_scheduler = KnobFlushScheduler()
+
+
+def get_flush_scheduler() -> KnobFlushScheduler:
+    """グローバルKnobFlushSchedulerを取得"""
+    return _scheduler
@@ -1,51 +1,108 @@
 # storybook/knob_store.py
 """Knob値のグローバル保存ストア"""
 
-from typing import TYPE_CHECKING, Any, Dict, Optional
+import weakref
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 if TYPE_CHECKING:
+    import tkinter as tk
+
     from .types import KnobValue
 
+# 型ごとに再利用のため保持しておく tk.Variable の上限
+_VAR_POOL_LIMIT = 32
+
 
 class KnobStore:
     """Knob値をストーリー間で永続化するグローバルストア"""
 
     def __init__(self):
-        # {story_id: {knob_name: value}}
-        self._values: Dict[str, Dict[str, Any]] = {}
-        # {story_id: {knob_name: KnobValue}}
-        self._knob_instances: Dict[str, Dict[str, "KnobValue"]] = {}
+        # {(story_id, knob_name): value}
+        self._values: Dict[Tuple[str, str], Any] = {}
+        # {(story_id, knob_name): KnobValue}
+        # インスタンスは弱参照で保持し、表示中のストーリー以外は GC に回収させる
+        # （値そのものは _values に残るため、再表示時に復元される）
+        self._knob_instances: weakref.WeakValueDictionary[
+            Tuple[str, str], "KnobValue"
+        ] = weakref.WeakValueDictionary()
+        # {story_id: {knob_name: None}}（ストーリーごとの Knob 名を登録順に保持）
+        self._by_story: Dict[str, Dict[str, None]] = {}
+        # {Variable の型: [再利用待ちの Variable]}
+        # 破棄されたコントロールの変数を次に作るコントロールで使い回す
+        self._var_pool: Dict[type, List["tk.Variable"]] = {}
 
     def get_value(self, story_id: str, knob_name: str, default: Any = None) -> Any:
         """保存されたknob値を取得"""
-        return self._values.get(story_id, {}).get(knob_name, default)
+        return self._values.get((story_id, knob_name), default)
 
     def set_value(self, story_id: str, knob_name: str, value: Any) -> None:
         """knob値を保存"""
-        if story_id not in self._values:
-            self._values[story_id] = {}
-        self._values[story_id][knob_name] = value
+        key = (story_id, knob_name)
+        if key not in self._values:
+            self._index(story_id, knob_name)
+        self._values[key] = value
 
     def get_knob_instance(self, story_id: str, knob_name: str) -> Optional["KnobValue"]:
         """KnobValueインスタンスを取得"""
-        return self._knob_instances.get(story_id, {}).get(knob_name)
+        return self._knob_instances.get((story_id, knob_name))
 
     def set_knob_instance(
         self, story_id: str, knob_name: str, knob_value: "KnobValue"
     ) -> None:
         """KnobValueインスタンスを保存"""
-        if story_id not in self._knob_instances:
-            self._knob_instances[story_id] = {}
-        self._knob_instances[story_id][knob_name] = knob_value
+        self._index(story_id, knob_name)
+        self._knob_instances[(story_id, knob_name)] = knob_value
+
+    def _index(self, story_id: str, knob_name: str) -> None:
+        """ストーリーごとの Knob 名索引に登録"""
+        names = self._by_story.get(story_id)
+        if names is None:
+            names = self._by_story[story_id] = {}
+        names[knob_name] = None
+
+    def acquire_var(self, var_type: type, initial: Any) -> "tk.Variable":
+        """再利用待ちの tk.Variable を取り出す（なければ作成）。
+
+        Knob UI を作り直しても Variable を使い回し、Tcl 変数とコマンドの
+        生成を繰り返さないようにする。取り出した変数は ``release_var`` で
+        返すまで呼び出し元のコントロールだけが使う。
+
+        Args:
+            var_type: 取り出す Variable のクラス。
+            initial: 設定する値。
+        """
+        pool = self._var_pool.get(var_type)
+        while pool:
+            var = pool.pop()
+            try:
+                var.set(initial)
+                return var
+            except Exception:
+                # 元の Tk インタプリタが破棄済み
+                continue
+        return var_type(value=initial)
+
+    def release_var(self, var: "tk.Variable") -> None:
+        """破棄したコントロールの変数を再利用待ちにする（トレースは外しておくこと）"""
+        pool = self._var_pool.setdefault(type(var), [])
+        if len(pool) < _VAR_POOL_LIMIT:
+            pool.append(var)
 
     def get_all_knobs(self, story_id: str) -> Dict[str, "KnobValue"]:
         """指定ストーリーの全KnobValueを取得"""
-        return self._knob_instances.get(story_id, {})
+        instances = self._knob_instances
+        knobs = {}
+        for name in self._by_story.get(story_id, ()):
+            knob = instances.get((story_id, name))
+            if knob is not None:
+                knobs[name] = knob
+        return knobs
 
     def clear_story(self, story_id: str) -> None:
         """指定ストーリーのknob値をクリア"""
-        self._values.pop(story_id, None)
-        self._knob_instances.pop(story_id, None)
+        for name in self._by_story.pop(story_id, ()):
+            self._values.pop((story_id, name), None)
+            self._knob_instances.pop((story_id, name), None)
 
 
 # グローバルインスタンス
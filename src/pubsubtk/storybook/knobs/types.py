@@ -3,35 +3,129 @@
 
 from __future__ import annotations
 
-from typing import Any, List, Optional, Union
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, List, Optional, Tuple, Union
 
-from pydantic import BaseModel, Field
 
+@dataclass(frozen=True, slots=True)
+class KnobSpec:
+    """Knobの仕様定義
 
-class KnobSpec(BaseModel):
-    """Knobの仕様定義"""
+    内部でのみ生成される固定の仕様オブジェクトのため、Pydantic モデルではなく
+    不変の dataclass とする。``type`` / ``range`` という名前の引数で作成する場合は
+    ``from_kwargs`` を使う。
+    """
 
     name: str
-    type_: type = Field(..., alias="type")
+    type_: type
     default: Any
     desc: str = ""
-    range_: Optional[tuple[Union[int, float], Union[int, float]]] = Field(
-        None, alias="range"
-    )
-    choices: Optional[List[str]] = None
+    range_: Optional[Tuple[Union[int, float], Union[int, float]]] = None
+    choices: Optional[Tuple[str, ...]] = None
     multiline: bool = False
 
-    class Config:
-        arbitrary_types_allowed = True
+    @classmethod
+    def from_kwargs(cls, **kwargs: Any) -> "KnobSpec":
+        """``type`` → ``type_``、``range`` → ``range_`` の別名を受け付けて作成する。"""
+        if "type" in kwargs:
+            kwargs["type_"] = kwargs.pop("type")
+        if "range" in kwargs:
+            kwargs["range_"] = kwargs.pop("range")
+        if kwargs.get("range_") is not None:
+            kwargs["range_"] = tuple(kwargs["range_"])
+        if kwargs.get("choices") is not None:
+            kwargs["choices"] = tuple(kwargs["choices"])
+        return cls(**kwargs)
+
+
+# 仕様の引数 -> 作成済み KnobSpec（最近使った順、古いものから捨てる）
+_SPEC_CACHE: "OrderedDict[tuple, KnobSpec]" = OrderedDict()
+# キャッシュしておく仕様の上限
+_SPEC_CACHE_LIMIT = 256
+
+
+def make_spec(
+    name: str,
+    type_: type,
+    default: Any,
+    desc: str = "",
+    range_: Optional[tuple] = None,
+    choices: Optional[List[str]] = None,
+    multiline: bool = False,
+) -> KnobSpec:
+    """KnobSpec を作成する。同じ引数の仕様は作成済みのものを再利用する。
+
+    ストーリー内の Knob 宣言は毎回同じ引数で呼ばれるため、
+    仕様オブジェクトの生成は宣言ごとに 1 回だけで済む。
+    ``1`` と ``1.0`` のように等価でも型の異なるデフォルト値は別の仕様として扱う。
+    """
+    key = (
+        name,
+        type_,
+        type(default),
+        default,
+        desc,
+        tuple(range_) if range_ is not None else None,
+        tuple(choices) if choices is not None else None,
+        multiline,
+    )
+    try:
+        spec = _SPEC_CACHE.get(key)
+        if spec is not None:
+            _SPEC_CACHE.move_to_end(key)
+    except TypeError:
+        # ハッシュ不可能なデフォルト値（リストなど）はキャッシュしない
+        key = None
+        spec = None
+
+    if spec is None:
+        spec = KnobSpec(
+            name=name,
+            type_=type_,
+            default=default,
+            desc=desc,
+            range_=tuple(range_) if range_ is not None else None,
+            choices=tuple(choices) if choices is not None else None,
+            multiline=multiline,
+        )
+        if key is not None:
+            _SPEC_CACHE[key] = spec
+            if len(_SPEC_CACHE) > _SPEC_CACHE_LIMIT:
+                _SPEC_CACHE.popitem(last=False)
+    return spec
 
 
 class KnobValue:
     """Knob値の動的オブジェクト（Story内で使用）"""
 
-    def __init__(self, spec: KnobSpec, initial_value: Any = None):
+    # KnobStore が弱参照で保持するため __weakref__ も確保する
+    __slots__ = (
+        "spec",
+        "story_id",
+        "_value",
+        "_callback",
+        "_callbacks",
+        "__weakref__",
+    )
+
+    def __init__(
+        self,
+        spec: KnobSpec,
+        initial_value: Any = None,
+        story_id: Optional[str] = None,
+    ):
         self.spec = spec
+        self.story_id = story_id
         self._value = initial_value if initial_value is not None else spec.default
-        self._callbacks: List[callable] = []
+        # コールバックは通常 1 つなので単独で保持し、2 つ目以降でリストに移す
+        self._callback: Optional[callable] = None
+        self._callbacks: Optional[List[callable]] = None
+
+    @property
+    def key(self) -> Tuple[Optional[str], str]:
+        """ストーリーをまたいで Knob を区別するキー ``(story_id, Knob 名)``"""
+        return (self.story_id, self.spec.name)
 
     @property
     def value(self) -> Any:
@@ -43,12 +137,21 @@ class KnobValue:
         """値を設定し、コールバックを実行"""
         if self._value != new_value:
             self._value = new_value
-            for callback in self._callbacks:
-                callback(new_value)
+            if self._callback is not None:
+                self._callback(new_value)
+            elif self._callbacks:
+                for callback in self._callbacks:
+                    callback(new_value)
 
     def add_change_callback(self, callback: callable) -> None:
         """値変更時のコールバックを追加"""
-        self._callbacks.append(callback)
+        if self._callbacks is not None:
+            self._callbacks.append(callback)
+        elif self._callback is None:
+            self._callback = callback
+        else:
+            self._callbacks = [self._callback, callback]
+            self._callback = None
 
     def __str__(self) -> str:
         return str(self._value)
@@ -11,13 +11,17 @@ class StorybookProcessor(ProcessorBase[StorybookState]):
     """Storybook 用のビジネスロジックをまとめる Processor"""
 
     def setup_subscriptions(self):
+        # 状態パス文字列はイベントごとに組み立てず、ここで一度だけ解決する
+        self._path_story = str(self.store.state.active_story_id)
+        self._path_layout = str(self.store.state.layout_mode)
+
         self.subscribe(SBTopic.SELECT_STORY, self.select_story)
         self.subscribe(SBTopic.TOGGLE_CANVAS, self.toggle_canvas)
 
     def select_story(self, story_id: str) -> None:
-        self.pub_update_state(str(self.store.state.active_story_id), story_id)
+        self.pub_update_state(self._path_story, story_id)
 
     def toggle_canvas(self) -> None:
-        cur = self.store.get_current_state().layout_mode
+        cur = self.store.get_state_view().layout_mode
         new_mode = "fullscreen" if cur == "normal" else "normal"
-        self.pub_update_state(str(self.store.state.layout_mode), new_mode)
+        self.pub_update_state(self._path_layout, new_mode)
@@ -1,7 +1,9 @@
 # storybook/views/preview.py - PreviewFrame
 """選択された Story を実際に描画するプレビューフレーム。"""
 
+import time
 import tkinter as tk
+from collections import OrderedDict
 from tkinter import ttk
 
 from pubsubtk import ContainerComponentTtk
@@ -14,63 +16,106 @@ from ..core.state import StorybookState
 class PreviewFrame(ContainerComponentTtk[StorybookState]):
     """中央のプレビューエリア（テーマ対応）"""
 
+    # 切り替え後も非表示のまま保持しておく描画済みストーリーの数。
+    # 保持中のストーリーの after やバックグラウンド処理は止まらないため既定は 0
+    story_cache_size: int = 0
+
     def setup_ui(self):
-        # 初期表示用の中央配置フレーム
-        self.center_frame = ttk.Frame(self)
-        self.center_frame.pack(expand=True)
-
-        # アイコンと説明文
-        icon_label = ttk.Label(self.center_frame, text="🎨", font=("", 48))
-        icon_label.pack(pady=(20, 10))
-
-        self.label = ttk.Label(
-            self.center_frame,
-            text="Select a story from the sidebar",
-            font=("", 12),
-            foreground="gray",
+        # ストーリーごとに作るラベルの見た目は名前付きスタイルで参照する
+        ttk.Style(self).configure(
+            "PreviewPath.TLabel", font=("", 10), foreground="gray"
+        )
+
+        # Knob 変更による再描画中かどうか / 再描画中に届いた変更があるか
+        self._rendering = False
+        self._rerender_pending = False
+        # ストーリー切り替えの描画予約（連続した選択は 1 回の描画にまとめる）
+        self._refresh_after = None
+        # 表示中のストーリーのコンテキスト（Knob 変更を差分で反映するため保持）
+        self._current_ctx: StoryContext | None = None
+        self._current_story_id: str | None = None
+        # {story_id: (フレーム, コンテキスト)}（最近表示した非表示のストーリー、古い順）
+        self._story_cache: OrderedDict[str, tuple[ttk.Frame, StoryContext]] = (
+            OrderedDict()
         )
-        self.label.pack()
+        # 表示中のストーリーのフレームと、使い回す空状態・エラー表示（初回表示時に作成）
+        self._story_frame: ttk.Frame | None = None
+        self._empty_frame: ttk.Frame | None = None
+        self._error_frame: ttk.Frame | None = None
+        self._error_label: ttk.Label | None = None
+
+        # 初期表示（ストーリー未選択）
+        self._show_empty_state()
 
     def setup_subscriptions(self):
         self.sub_for_refresh(str(self.store.state.active_story_id), self._refresh)
         # Knob変更時の再描画を購読
         self.subscribe("storybook.knob.changed", self._on_knob_changed)
+        self.subscribe("storybook.knobs.batch_changed", self._on_knobs_batch_changed)
 
     def refresh_from_state(self):
         # 初期化時の処理
         self._refresh()
 
     def _refresh(self):
-        # 既存ウィジェット破棄
-        for w in self.winfo_children():
-            w.destroy()
+        """選択中のストーリーの描画をアイドル時に予約する。
+
+        サイドバーで選択が連続しても、描画は最後に選ばれたストーリーの 1 回だけ行う。
+        """
+        if self._refresh_after is None:
+            self._refresh_after = self.after_idle(self._do_refresh)
+
+    def _do_refresh(self):
+        """選択中のストーリーを描画し、KnobPanel にも Knob 情報を送信する。"""
+        self._refresh_after = None
+        self._render_story(update_knobs=True)
+
+    def _render_story(self, update_knobs: bool):
+        """選択中のストーリーを描画する。
 
-        story_id = self.store.get_current_state().active_story_id
+        Args:
+            update_knobs: KnobPanel に Knob 情報を送信するかどうか。
+                Knob 値変更による再描画ではパネルの再構築を避けるため ``False``。
+        """
+        # 既存ウィジェット破棄（ストーリー切り替え時は破棄せずにキャッシュへ）
+        self._clear(keep_story=update_knobs)
+
+        story_id = self.store.get_state_view().active_story_id
         if not story_id:
             self._show_empty_state()
-            # 空のストーリー時はKnobPanelをクリア
-            self.publish("storybook.knobs.update", knob_values={})
+            if update_knobs:
+                # 空のストーリー時はKnobPanelをクリア
+                self.publish("storybook.knobs.update", knob_values={})
             return
 
-        stories = [m for m in StoryRegistry.list() if m.id == story_id]
-        if not stories:
+        if update_knobs:
+            cached = self._story_cache.pop(story_id, None)
+            if cached is not None:
+                # 最近表示したストーリーは作り直さずに再表示する
+                frame, ctx = cached
+                frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+                self._story_frame = frame
+                self._current_ctx = ctx
+                self._current_story_id = story_id
+                self.publish("storybook.knobs.update", knob_values=ctx.knob_values)
+                return
+
+        meta = StoryRegistry.by_id().get(story_id)
+        if meta is None:
             self._show_error_state("Story not found")
             return
 
-        meta = stories[0]
-
         try:
             # コンテンツフレーム作成
-            content_frame = ttk.Frame(self)
+            content_frame = self._story_frame = ttk.Frame(self)
             content_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
             # Story情報ヘッダー
             info_frame = ttk.Frame(content_frame)
             info_frame.pack(fill=tk.X, pady=(0, 10))
 
-            path_text = " > ".join(meta.path + [meta.title])
             ttk.Label(
-                info_frame, text=path_text, font=("", 10), foreground="gray"
+                info_frame, text=meta.breadcrumb, style="PreviewPath.TLabel"
             ).pack(side=tk.LEFT)
 
             # 区切り線
@@ -86,94 +131,131 @@ class PreviewFrame(ContainerComponentTtk[StorybookState]):
             ctx.set_publish_callback(self.publish)
             ctx.set_story_id(story_id)  # ストーリーIDを設定して値を永続化
 
+            started = time.perf_counter()
             widget = meta.factory(ctx)
             widget.pack(fill=tk.BOTH, expand=True)
+            self._current_ctx = ctx
+            self._current_story_id = story_id
+
+            # 描画時間を通知（KnobPanelがスライダー通知の間引きに使う）
+            self.publish(
+                "storybook.rebuild.time",
+                ms=(time.perf_counter() - started) * 1000,
+            )
 
-            # KnobPanelにKnob情報を送信
-            self.publish("storybook.knobs.update", knob_values=ctx.knob_values)
+            if update_knobs:
+                # KnobPanelにKnob情報を送信
+                self.publish("storybook.knobs.update", knob_values=ctx.knob_values)
 
         except Exception as e:
             self._show_error_state(f"Error rendering story: {str(e)}")
 
+    def _clear(self, keep_story: bool = False):
+        """表示中のストーリーを片付け、空状態・エラー表示を隠す
+
+        Args:
+            keep_story: 描画に成功したストーリーを破棄せずに隠して
+                キャッシュに残すかどうか（ストーリー切り替え時）。
+        """
+        frame, ctx, story_id = (
+            self._story_frame,
+            self._current_ctx,
+            self._current_story_id,
+        )
+        self._story_frame = None
+        self._current_ctx = None
+        self._current_story_id = None
+        if frame is not None:
+            if keep_story and ctx is not None and story_id is not None:
+                frame.pack_forget()
+                cache = self._story_cache
+                cache[story_id] = (frame, ctx)
+                while len(cache) > self.story_cache_size:
+                    _, (old_frame, _) = cache.popitem(last=False)
+                    old_frame.destroy()
+            else:
+                frame.destroy()
+        if self._empty_frame is not None:
+            self._empty_frame.pack_forget()
+        if self._error_frame is not None:
+            self._error_frame.pack_forget()
+
     def _show_empty_state(self):
-        """空の状態を表示"""
-        center_frame = ttk.Frame(self)
-        center_frame.pack(expand=True)
+        """空の状態を表示（ウィジェットは初回のみ作成して使い回す）"""
+        if self._empty_frame is None:
+            center_frame = self._empty_frame = ttk.Frame(self)
 
-        icon_label = ttk.Label(center_frame, text="🎨", font=("", 48))
-        icon_label.pack(pady=(20, 10))
+            icon_label = ttk.Label(center_frame, text="🎨", font=("", 48))
+            icon_label.pack(pady=(20, 10))
 
-        ttk.Label(
-            center_frame,
-            text="Select a story from the sidebar",
-            font=("", 12),
-            foreground="gray",
-        ).pack()
+            ttk.Label(
+                center_frame,
+                text="Select a story from the sidebar",
+                font=("", 12),
+                foreground="gray",
+            ).pack()
+        self._empty_frame.pack(expand=True)
 
     def _show_error_state(self, message: str):
-        """エラー状態を表示"""
-        center_frame = ttk.Frame(self)
-        center_frame.pack(expand=True)
+        """エラー状態を表示（ウィジェットは初回のみ作成して使い回す）"""
+        if self._error_frame is None:
+            center_frame = self._error_frame = ttk.Frame(self)
 
-        icon_label = ttk.Label(center_frame, text="⚠️", font=("", 48))
-        icon_label.pack(pady=(20, 10))
+            icon_label = ttk.Label(center_frame, text="⚠️", font=("", 48))
+            icon_label.pack(pady=(20, 10))
 
-        ttk.Label(center_frame, text=message, font=("", 12), foreground="red").pack()
+            self._error_label = ttk.Label(
+                center_frame, font=("", 12), foreground="red"
+            )
+            self._error_label.pack()
+        self._error_label.configure(text=message)
+        self._error_frame.pack(expand=True)
 
     def _refresh_story_only(self):
-        """Knob値変更時のstoryのみ再描画（KnobUIは更新しない）"""
-        # 既存ウィジェット破棄
-        for w in self.winfo_children():
-            w.destroy()
-
-        story_id = self.store.get_current_state().active_story_id
-        if not story_id:
-            self._show_empty_state()
-            return
-
-        stories = [m for m in StoryRegistry.list() if m.id == story_id]
-        if not stories:
-            self._show_error_state("Story not found")
+        """Knob値変更時のstoryのみ再描画（KnobUIは更新しない）
+
+        ストーリーが updater を登録していればウィジェットは作り直さず、
+        updater で値だけを反映する。
+        再描画中（ストーリーの factory が Knob 値を書き換えた場合など）に
+        届いた変更はその場で再描画せず、描画完了後にまとめて 1 回だけ描き直す。
+        """
+        if self._rendering:
+            self._rerender_pending = True
             return
 
-        meta = stories[0]
-
+        self._rendering = True
         try:
-            # コンテンツフレーム作成
-            content_frame = ttk.Frame(self)
-            content_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-
-            # Story情報ヘッダー
-            info_frame = ttk.Frame(content_frame)
-            info_frame.pack(fill=tk.X, pady=(0, 10))
-
-            path_text = " > ".join(meta.path + [meta.title])
-            ttk.Label(
-                info_frame, text=path_text, font=("", 10), foreground="gray"
-            ).pack(side=tk.LEFT)
-
-            # 区切り線
-            ttk.Separator(content_frame, orient=tk.HORIZONTAL).pack(
-                fill=tk.X, pady=(0, 10)
-            )
-
-            # Story実行エリア
-            story_frame = ttk.Frame(content_frame)
-            story_frame.pack(fill=tk.BOTH, expand=True)
-
-            ctx = StoryContext(parent=story_frame)
-            ctx.set_publish_callback(self.publish)
-            ctx.set_story_id(story_id)  # ストーリーIDを設定して値を永続化
-
-            widget = meta.factory(ctx)
-            widget.pack(fill=tk.BOTH, expand=True)
-
-            # 注意: KnobPanelには通知しない（knob値変更時はUI再構築を避ける）
-
-        except Exception as e:
-            self._show_error_state(f"Error rendering story: {str(e)}")
+            while True:
+                self._rerender_pending = False
+                self._apply_knob_changes()
+                if not self._rerender_pending:
+                    break
+        finally:
+            self._rendering = False
+
+    def _apply_knob_changes(self):
+        """表示中のストーリーに Knob の変更を反映する（できなければ再描画）"""
+        ctx = self._current_ctx
+        if ctx is not None:
+            started = time.perf_counter()
+            try:
+                if ctx.apply_knob_changes():
+                    self.publish(
+                        "storybook.rebuild.time",
+                        ms=(time.perf_counter() - started) * 1000,
+                    )
+                    return
+            except Exception as e:
+                self._clear()
+                self._show_error_state(f"Error updating story: {str(e)}")
+                return
+        self._render_story(update_knobs=False)
 
     def _on_knob_changed(self, knob_name: str, value):
         """Knob値変更時のコールバック（ストーリー再描画）"""
         # knob値変更時はstoryのみ更新、KnobUIは再構築しない
         self._refresh_story_only()
+
+    def _on_knobs_batch_changed(self, changes: dict):
+        """KnobPanel.hold() でまとめられた Knob 変更時のコールバック（再描画は 1 回）"""
+        self._refresh_story_only()
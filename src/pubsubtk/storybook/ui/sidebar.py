@@ -6,10 +6,30 @@ from tkinter import ttk
 
 from pubsubtk import ContainerComponentTtk
 
-from ..core.registry import StoryRegistry
+from ..core.registry import StoryRegistry, StoryTreeNode
 from ..core.state import StorybookState
 from ..processors.topics import SBTopic
 
+# 子ノード未作成のフォルダに置く仮の子（展開マーカーを表示させるため）
+_PLACEHOLDER_SUFFIX = ".__placeholder"
+
+
+def _make_icons(master: tk.Misc) -> tuple[tk.PhotoImage, tk.PhotoImage]:
+    """フォルダ・ストーリー用の 16x16 アイコンを作成する。
+
+    行ごとに絵文字を描画するより、Tk がキャッシュする画像の方が描画が軽い。
+    """
+    folder = tk.PhotoImage(master=master, width=16, height=16)
+    folder.put("#d9a53f", to=(1, 2, 7, 4))  # タブ
+    folder.put("#e8b84a", to=(1, 4, 15, 14))
+
+    leaf = tk.PhotoImage(master=master, width=16, height=16)
+    leaf.put("#8a8a8a", to=(3, 1, 13, 15))  # 枠
+    leaf.put("#ffffff", to=(4, 2, 12, 14))
+    leaf.put("#b0b0b0", to=(5, 5, 11, 6))  # 行
+    leaf.put("#b0b0b0", to=(5, 8, 11, 9))
+    return folder, leaf
+
 
 class SidebarView(ContainerComponentTtk[StorybookState]):
     """左側のツリーサイドバー（テーマ対応）"""
@@ -32,6 +52,8 @@ class SidebarView(ContainerComponentTtk[StorybookState]):
 
         # ツリービュー
         self.tree = ttk.Treeview(tree_frame, show="tree")
+        # 画像は参照を保持しておかないと破棄される
+        self._folder_icon, self._leaf_icon = _make_icons(self)
 
         # スクロールバー
         scrollbar = ttk.Scrollbar(
@@ -44,8 +66,11 @@ class SidebarView(ContainerComponentTtk[StorybookState]):
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
         # データ投入とイベント設定
+        # {iid: 子ノード未作成のフォルダ}
+        self._lazy_nodes: dict[str, StoryTreeNode] = {}
         self._populate()
         self.tree.bind("<<TreeviewSelect>>", self._on_select)
+        self.tree.bind("<<TreeviewOpen>>", self._on_open)
 
         # ツリーのスタイル調整
         style = ttk.Style()
@@ -60,22 +85,56 @@ class SidebarView(ContainerComponentTtk[StorybookState]):
         pass
 
     def _populate(self):
-        for meta in StoryRegistry.list():
-            parent_id = ""
-            for seg in meta.path:
-                node_id = f"{parent_id}.{seg}" if parent_id else seg
-                if not self.tree.exists(node_id):
+        # 最上位のフォルダだけ展開して表示し、それより深い階層は
+        # 開かれたときに作成する（ストーリー数が多くても起動時の挿入を抑える）
+        self._insert_node(StoryRegistry.tree(), "", expand=True)
+
+    def _insert_node(
+        self, node: StoryTreeNode, parent_id: str, expand: bool = False
+    ):
+        """階層ツリーのノードの直下の要素を登録順に Treeview へ挿入する。
+
+        Args:
+            node: 挿入する要素を持つノード。
+            parent_id: 挿入先の親の iid。
+            expand: 直下のフォルダを展開した状態で作成するかどうか。
+                ``False`` の場合、フォルダの中身は開かれたときに作成する。
+        """
+        for entry in node.entries:
+            if isinstance(entry, StoryTreeNode):
+                self.tree.insert(
+                    parent_id,
+                    "end",
+                    iid=entry.dotted,
+                    text=entry.name,
+                    image=self._folder_icon,
+                    open=expand,
+                )
+                if expand:
+                    self._insert_node(entry, entry.dotted)
+                else:
+                    self._lazy_nodes[entry.dotted] = entry
                     self.tree.insert(
-                        parent_id, "end", iid=node_id, text=f"📁 {seg}", open=True
+                        entry.dotted, "end", iid=entry.dotted + _PLACEHOLDER_SUFFIX
                     )
-                parent_id = node_id
-            self.tree.insert(
-                parent_id,
-                "end",
-                iid=meta.id,
-                text=f"📄 {meta.title}",
-                values=(meta.id,),
-            )
+            else:
+                self.tree.insert(
+                    parent_id,
+                    "end",
+                    iid=entry.id,
+                    text=entry.title,
+                    image=self._leaf_icon,
+                    values=(entry.id,),
+                )
+
+    def _on_open(self, _):
+        """フォルダが開かれたとき、未作成の子ノードを作成する"""
+        iid = self.tree.focus()
+        node = self._lazy_nodes.pop(iid, None)
+        if node is None:
+            return
+        self.tree.delete(iid + _PLACEHOLDER_SUFFIX)
+        self._insert_node(node, iid)
 
     def _on_select(self, _):
         sel = self.tree.selection()
@@ -6,6 +6,7 @@ src/pubsubtk/topic/topics.py
 アプリケーションで使用する PubSub トピック列挙型を提供します。
 """
 
+import sys
 from enum import StrEnum, auto
 
 
@@ -22,13 +23,14 @@ class AutoNamedTopic(StrEnum):
 
     def __new__(cls, value):
         # ここでクラス名プレフィックスを追加
-        full = f"{cls.__name__}.{value}"
+        # （トピック名は pypubsub の辞書キーとして繰り返し使うため intern しておく）
+        full = sys.intern(f"{cls.__name__}.{value}")
         obj = str.__new__(cls, full)
         obj._value_ = full
         return obj
 
-    def __str__(self):
-        return self.value
+    # メンバー自身が値と同じ文字列なので、value 属性を経由せずに文字列化する
+    __str__ = str.__str__
 
 
 class DefaultNavigateTopic(AutoNamedTopic):
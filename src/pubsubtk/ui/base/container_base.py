@@ -4,18 +4,42 @@ src/pubsubtk/ui/base/container_base.py
 状態連携可能な UI コンテナの基底クラスを定義します。
 """
 
+import time
 import tkinter as tk
 from abc import ABC, abstractmethod
+from functools import partial
 from tkinter import ttk
-from typing import Any, Generic, TypeVar
+from typing import Any, Callable, Dict, Generic, Optional, Tuple, TypeVar
 
 from pydantic import BaseModel
 
 from pubsubtk.core.default_topic_base import PubSubDefaultTopicBase
 from pubsubtk.store.store import Store
+from pubsubtk.topic.topics import DefaultUpdateTopic
 
 TState = TypeVar("TState", bound=BaseModel)
 
+# 状態パスが解決できなかったことを表す番兵
+_MISSING: Any = object()
+
+
+def _is_unchanged(old_value: Any, new_value: Any) -> bool:
+    """再描画の要否判定で、前回通知時から値が変わっていないか判定する。
+
+    同一オブジェクトのモデルやコンテナは、その場で書き換えたうえで
+    ``update_state`` に渡された可能性があるため変更ありとして扱う。
+    """
+    if old_value is _MISSING or new_value is _MISSING:
+        return False
+    if old_value is new_value:
+        return not isinstance(new_value, (BaseModel, list, dict, set))
+    if type(old_value) is not type(new_value):
+        return False
+    try:
+        return bool(old_value == new_value)
+    except Exception:
+        return False
+
 
 class ContainerMixin(PubSubDefaultTopicBase, ABC, Generic[TState]):
     """
@@ -29,6 +53,11 @@ class ContainerMixin(PubSubDefaultTopicBase, ABC, Generic[TState]):
     manually publishing to topics. This provides better IDE support and consistency.
     """
 
+    # sub_for_refresh の通知をアイドル時にまとめて処理するかどうか
+    coalesce_refresh: bool = True
+    # まとめて処理する場合の最大再描画頻度（回/秒）。None なら制限しない
+    max_refresh_hz: Optional[float] = None
+
     def __init__(self, store: Store[TState], *args, **kwargs: Any):
         """コンテナの初期化を行う。
 
@@ -48,7 +77,20 @@ class ContainerMixin(PubSubDefaultTopicBase, ABC, Generic[TState]):
         # 型引数付きの Store[TState] を取得
         self.store: Store[TState] = store
 
-        super().__init__(*args, **kwargs)
+        # {(トピック, ハンドラー): (購読したラッパー, 状態パス)}
+        # （unsubscribe で元のハンドラーから引く）
+        self._refresh_wrappers: Dict[
+            Tuple[str, Callable], Tuple[Callable[[], None], str]
+        ] = {}
+        # {(状態パス, ハンドラー): 前回 handler を呼んだ時の値}
+        self._refresh_snapshots: Dict[Tuple[str, Callable[[], None]], Any] = {}
+        # 処理待ちの再描画通知 {(状態パス, ハンドラー): None} と、その処理予約
+        self._pending_refresh: Dict[Tuple[str, Callable[[], None]], None] = {}
+        self._refresh_flush_id: Optional[str] = None
+        self._last_refresh_flush = 0.0
+
+        # PubSubBase.__init__ は super() を呼ばないため、MRO をたどらず直接呼ぶ
+        PubSubDefaultTopicBase.__init__(self)
 
         self.setup_ui()
         self.refresh_from_state()
@@ -69,11 +111,105 @@ class ContainerMixin(PubSubDefaultTopicBase, ABC, Generic[TState]):
         """
         ...
 
+    def sub_for_refresh(self, state_path: str, handler: Callable[[], None]) -> None:
+        """状態が更新されたときの再描画通知を購読する。
+
+        通知を受けたら監視中のパスの値を前回 ``handler`` を呼んだ時の値と比べ、
+        ``==`` で等しければ呼び出さない（同じ値での更新などによる無駄な再描画を
+        省く）。モデルやリストが同一オブジェクトのまま更新された場合は、
+        その場で書き換えられたものとみなして呼び出す。
+
+        ``coalesce_refresh`` が有効な場合（既定）、通知はアイドル時にまとめて
+        処理し、短時間に何度更新されても ``handler`` は 1 回だけ呼び出す。
+        購読の解除は ``unsubscribe(topic, handler)`` に元の ``handler`` を渡せばよい。
+
+        Args:
+            state_path: 監視する状態のパス。
+            handler: 値が変わったときに呼び出される引数なしの関数。
+        """
+        path = str(state_path)
+        topic = f"{DefaultUpdateTopic.STATE_UPDATED}.{path}"
+        key = (topic, handler)
+        if key in self._refresh_wrappers:
+            return
+        wrapper = partial(self._on_refresh_notified, path, handler)
+        self._refresh_wrappers[key] = (wrapper, path)
+        self._refresh_snapshots[(path, handler)] = self._read_state_path(path)
+        self.subscribe(topic, wrapper)
+
+    def unsubscribe(self, topic: str, handler: Callable) -> None:
+        """購読を解除する（``sub_for_refresh`` で登録したハンドラーも扱う）。"""
+        entry = self._refresh_wrappers.pop((str(topic), handler), None)
+        if entry is not None:
+            wrapper, path = entry
+            self._refresh_snapshots.pop((path, handler), None)
+            self._pending_refresh.pop((path, handler), None)
+            handler = wrapper
+        super().unsubscribe(topic, handler)
+
+    def _on_refresh_notified(self, path: str, handler: Callable[[], None]) -> None:
+        """再描画通知を受け取り、即時またはアイドル時に処理する。"""
+        if not self.coalesce_refresh:
+            if self._refresh_changed(path, handler):
+                handler()
+            return
+
+        self._pending_refresh[(path, handler)] = None
+        if self._refresh_flush_id is not None:
+            return
+        if self.max_refresh_hz:
+            wait = self._last_refresh_flush + 1 / self.max_refresh_hz - time.monotonic()
+            if wait > 0:
+                self._refresh_flush_id = self.after(
+                    int(wait * 1000) + 1, self._flush_refresh
+                )
+                return
+        self._refresh_flush_id = self.after_idle(self._flush_refresh)
+
+    def _flush_refresh(self) -> None:
+        """処理待ちの再描画通知をまとめて処理する。"""
+        self._refresh_flush_id = None
+        self._last_refresh_flush = time.monotonic()
+        pending, self._pending_refresh = self._pending_refresh, {}
+        # 複数のパスで同じハンドラーを購読していても 1 回だけ呼び出す
+        handlers: Dict[Callable[[], None], None] = {}
+        for path, handler in pending:
+            if self._refresh_changed(path, handler):
+                handlers[handler] = None
+        for handler in handlers:
+            handler()
+
+    def _refresh_changed(self, path: str, handler: Callable[[], None]) -> bool:
+        """監視中のパスの値が前回から変わっていれば記録し直して ``True`` を返す。"""
+        key = (path, handler)
+        value = self._read_state_path(path)
+        if _is_unchanged(self._refresh_snapshots.get(key, _MISSING), value):
+            return False
+        self._refresh_snapshots[key] = value
+        return True
+
+    def _read_state_path(self, path: str) -> Any:
+        """状態パスの現在値を取得する（解決できなければ ``_MISSING``）。"""
+        try:
+            return self.store.get_value(path)
+        except (AttributeError, ValueError):
+            return _MISSING
+
+    def _release_container(self) -> None:
+        """予約中の再描画を取り消し、購読を解除する。"""
+        if self._refresh_flush_id is not None:
+            self.after_cancel(self._refresh_flush_id)
+            self._refresh_flush_id = None
+        self._pending_refresh.clear()
+        self._refresh_snapshots.clear()
+        self._refresh_wrappers.clear()
+        self.teardown()
+
     def destroy(self) -> None:
         """
         ウィジェット破棄時に購読を解除してから破棄処理を行う。
         """
-        self.teardown()
+        self._release_container()
         super().destroy()
 
 
@@ -82,6 +218,9 @@ class ContainerComponentTk(ContainerMixin[TState], tk.Frame, Generic[TState]):
     標準tk.FrameベースのPubSub連携コンテナ。
     """
 
+    # 破棄のたびに MRO をたどらないよう、フレームの destroy を直接保持する
+    _frame_destroy = tk.Frame.destroy
+
     def __init__(self, parent: tk.Widget, store: Store[TState], *args, **kwargs: Any):
         """tk.Frame ベースのコンテナを初期化する。
 
@@ -93,12 +232,20 @@ class ContainerComponentTk(ContainerMixin[TState], tk.Frame, Generic[TState]):
         tk.Frame.__init__(self, master=parent)
         ContainerMixin.__init__(self, store=store, *args, **kwargs)
 
+    def destroy(self) -> None:
+        """購読を解除してからフレームを破棄する。"""
+        self._release_container()
+        self._frame_destroy()
+
 
 class ContainerComponentTtk(ContainerMixin[TState], ttk.Frame, Generic[TState]):
     """
     テーマ対応ttk.FrameベースのPubSub連携コンテナ。
     """
 
+    # 破棄のたびに MRO をたどらないよう、フレームの destroy を直接保持する
+    _frame_destroy = ttk.Frame.destroy
+
     def __init__(self, parent: tk.Widget, store: Store[TState], *args, **kwargs: Any):
         """ttk.Frame ベースのコンテナを初期化する。
 
@@ -109,3 +256,8 @@ class ContainerComponentTtk(ContainerMixin[TState], ttk.Frame, Generic[TState]):
 
         ttk.Frame.__init__(self, master=parent)
         ContainerMixin.__init__(self, store=store, *args, **kwargs)
+
+    def destroy(self) -> None:
+        """購読を解除してからフレームを破棄する。"""
+        self._release_container()
+        self._frame_destroy()
@@ -7,7 +7,10 @@ src/pubsubtk/ui/base/presentational_base.py
 import tkinter as tk
 from abc import ABC, abstractmethod
 from tkinter import ttk
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, Optional
+
+# dedup 指定のイベントがまだ一度も発火していないことを表す番兵
+_NOT_FIRED = object()
 
 
 class PresentationalMixin(ABC):
@@ -30,7 +33,10 @@ class PresentationalMixin(ABC):
         self.args = args
         self.kwargs = kwargs
 
-        self._handlers: Dict[str, Callable[..., Any]] = {}
+        # ハンドラーを登録しないコンポーネントが多いため、辞書は初回登録時に作る
+        self._handlers: Optional[Dict[str, Callable[..., Any]]] = None
+        # {dedup 指定のイベント名: 前回発火時の引数}（dedup 指定時に作る）
+        self._last_event_kw: Optional[Dict[str, Any]] = None
         self.setup_ui()
 
     @abstractmethod
@@ -41,12 +47,47 @@ class PresentationalMixin(ABC):
         """
         pass
 
-    def register_handler(self, event_name: str, handler: Callable[..., Any]) -> None:
+    def register_handler(
+        self, event_name: str, handler: Callable[..., Any], dedup: bool = False
+    ) -> None:
+        """イベントハンドラーを登録する。
+
+        Args:
+            event_name: イベント名。
+            handler: ``trigger_event`` で呼び出される関数。
+            dedup: ``True`` の場合、前回と同じ引数での発火ではハンドラーを
+                呼び出さない（リサイズやスクロールなど同じ値が続くイベント向け）。
+        """
+        if self._handlers is None:
+            self._handlers = {}
         self._handlers[event_name] = handler
 
+        if dedup:
+            if self._last_event_kw is None:
+                self._last_event_kw = {}
+            self._last_event_kw[event_name] = _NOT_FIRED
+        elif self._last_event_kw:
+            self._last_event_kw.pop(event_name, None)
+
     def trigger_event(self, event_name: str, **kwargs: Any) -> None:
-        if handler := self._handlers.get(event_name):
-            handler(**kwargs)
+        if not (self._handlers and (handler := self._handlers.get(event_name))):
+            return
+
+        last = self._last_event_kw
+        if last and event_name in last:
+            try:
+                # キーは重複しないため、並べ替えで値同士が比較されることはない
+                key = tuple(sorted(kwargs.items()))
+                hash(key)
+            except TypeError:
+                # ハッシュできない値を含む場合は比較せずに常に発火する
+                key = _NOT_FIRED
+            else:
+                if key == last[event_name]:
+                    return
+            last[event_name] = key
+
+        handler(**kwargs)
 
 
 # tk.Frame ベース の抽象クラス
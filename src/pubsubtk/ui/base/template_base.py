@@ -5,14 +5,27 @@
 from __future__ import annotations
 
 import tkinter as tk
+import weakref
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from functools import lru_cache
 from tkinter import ttk
-from typing import TYPE_CHECKING, Dict, Generic, TypeVar
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    Mapping,
+    TypeVar,
+)
 
 from pydantic import BaseModel
 
 from pubsubtk.store.store import Store
-from pubsubtk.ui.base.container_base import ContainerMixin
+from pubsubtk.ui.types import is_container_component
 
 if TYPE_CHECKING:
     from pubsubtk.ui.types import ComponentType
@@ -20,6 +33,26 @@ if TYPE_CHECKING:
 TState = TypeVar("TState", bound=BaseModel)
 
 
+# kwargs 省略時に共有する空の引数（呼び出しごとに辞書を作らない）
+_EMPTY_KW = MappingProxyType({})
+
+
+@lru_cache(maxsize=512)
+def _make_factory(cls: type) -> Callable[[tk.Widget, Store, Any], tk.Widget]:
+    """コンポーネントクラスごとの生成関数を返す（Container なら store も渡す）"""
+    if is_container_component(cls):
+
+        def factory(parent, store, kwargs):
+            return cls(parent=parent, store=store, **kwargs)
+
+    else:
+
+        def factory(parent, store, kwargs):
+            return cls(parent=parent, **kwargs)
+
+    return factory
+
+
 class TemplateMixin(ABC, Generic[TState]):
     """
     テンプレートコンポーネント用のMixin。
@@ -32,16 +65,24 @@ class TemplateMixin(ABC, Generic[TState]):
         各スロットに配置されるコンポーネントが独自に状態管理を行う。
     """
 
+    # スロット切り替えの最後に update_idletasks() でレイアウトを確定させるかどうか
+    update_idletasks_on_swap: bool = True
+
     def __init__(self, store: Store[TState], *args, **kwargs):
         """Mixin の初期化処理。"""
 
         self.store = store
         self._slots: Dict[str, tk.Widget] = {}
-        self._slot_contents: Dict[str, tk.Widget] = {}
+        # 破棄されたコンテンツが残らないよう弱参照で保持する
+        self._slot_contents: weakref.WeakValueDictionary[str, tk.Widget] = (
+            weakref.WeakValueDictionary()
+        )
 
         # テンプレートのセットアップ
         self.setup_template()
         self._slots = self.define_slots()
+        # get_slots() で返す読み取り専用ビュー（呼び出しごとにコピーしない）
+        self._slots_view: Mapping[str, tk.Widget] = MappingProxyType(self._slots)
 
     def setup_template(self) -> None:
         """
@@ -76,9 +117,40 @@ class TemplateMixin(ABC, Generic[TState]):
                 "main": self.main_frame,
                 "footer": self.footer_frame
             }
+
+            スロットが多い場合は ``with self.batch_layout():`` の中で配置すると、
+            レイアウト計算を最後の 1 回にまとめられる。
         """
         pass
 
+    @contextmanager
+    def batch_layout(
+        self, widget: tk.Misc | None = None, flush: bool = True
+    ) -> Iterator[None]:
+        """ブロック内の配置変更によるサイズ伝播を止め、終了時に 1 回だけ反映する。
+
+        Args:
+            widget: サイズ伝播を止めるウィジェット。省略時はテンプレート自身。
+            flush: 終了時に ``update_idletasks()`` を呼んでレイアウトを確定させるか。
+                ``False`` の場合は通常のアイドル処理に任せる。
+
+        Note:
+            終了時は ``update()`` ではなく ``update_idletasks()`` を呼ぶため、
+            ブロック内でユーザー入力などのイベントが処理されることはない。
+        """
+        widget = self if widget is None else widget
+        pack_propagate = widget.pack_propagate()
+        grid_propagate = widget.grid_propagate()
+        widget.pack_propagate(False)
+        widget.grid_propagate(False)
+        try:
+            yield
+        finally:
+            widget.pack_propagate(pack_propagate)
+            widget.grid_propagate(grid_propagate)
+            if flush:
+                widget.update_idletasks()
+
     def switch_slot_content(
         self, slot_name: str, cls: ComponentType, kwargs: dict = None
     ) -> None:
@@ -89,38 +161,49 @@ class TemplateMixin(ABC, Generic[TState]):
             slot_name: スロット名
             cls: コンポーネントクラス（Container/Presentational両対応）
             kwargs: コンポーネントに渡す引数
+
+        Note:
+            切り替え中にイベントが処理されないよう、レイアウトの確定には
+            ``update_idletasks()`` だけを使う。コンポーネントの ``setup_ui()`` など
+            切り替え中に呼ばれる処理では ``update()`` を呼ばないこと。
         """
         if slot_name not in self._slots:
             raise ValueError(f"Unknown slot: {slot_name}")
 
-        # 既存のコンテンツを破棄
-        if slot_name in self._slot_contents:
-            self._slot_contents[slot_name].destroy()
-
-        # 新しいコンテンツを作成
         parent_frame = self._slots[slot_name]
-        content = self._create_component_for_slot(cls, parent_frame, kwargs)
-        content.pack(fill=tk.BOTH, expand=True)
+        # 破棄と配置によるレイアウト計算を 1 回にまとめる
+        with self.batch_layout(parent_frame, flush=self.update_idletasks_on_swap):
+            # 既存のコンテンツを破棄
+            old_content = self._slot_contents.get(slot_name)
+            if old_content is not None:
+                old_content.destroy()
+
+            # 新しいコンテンツを作成
+            content = self._create_component_for_slot(cls, parent_frame, kwargs)
+            content.pack(fill=tk.BOTH, expand=True)
 
         self._slot_contents[slot_name] = content
+        # どこで破棄されてもスロットの登録から外れるようにする
+        content.bind(
+            "<Destroy>",
+            lambda e, s=slot_name: self._on_slot_content_destroy(s, e.widget),
+            add="+",
+        )
+
+    def _on_slot_content_destroy(self, slot_name: str, widget: tk.Misc) -> None:
+        """破棄されたコンテンツをスロットの登録から外す"""
+        if self._slot_contents.get(slot_name) is widget:
+            del self._slot_contents[slot_name]
 
     def _create_component_for_slot(
         self, cls: ComponentType, parent: tk.Widget, kwargs: dict = None
     ) -> tk.Widget:
         """スロット用のコンポーネント生成"""
-        kwargs = kwargs or {}
-
-        # ContainerMixinを継承しているかチェック
-        is_container = issubclass(cls, ContainerMixin)
+        return _make_factory(cls)(parent, self.store, kwargs or _EMPTY_KW)
 
-        if is_container:
-            return cls(parent=parent, store=self.store, **kwargs)
-        else:
-            return cls(parent=parent, **kwargs)
-
-    def get_slots(self) -> Dict[str, tk.Widget]:
-        """定義されているスロットの辞書を返す"""
-        return self._slots.copy()
+    def get_slots(self) -> Mapping[str, tk.Widget]:
+        """定義されているスロットの読み取り専用ビューを返す（変更すると TypeError）"""
+        return self._slots_view
 
     def get_slot_content(self, slot_name: str) -> tk.Widget | None:
         """指定スロットの現在のコンテンツを返す"""
@@ -132,9 +215,10 @@ class TemplateMixin(ABC, Generic[TState]):
 
     def clear_slot(self, slot_name: str) -> None:
         """指定スロットのコンテンツをクリアする"""
-        if slot_name in self._slot_contents:
-            self._slot_contents[slot_name].destroy()
-            del self._slot_contents[slot_name]
+        content = self._slot_contents.get(slot_name)
+        if content is not None:
+            # 登録からは <Destroy> のハンドラーで外れる
+            content.destroy()
 
     def clear_all_slots(self) -> None:
         """すべてのスロットのコンテンツをクリアする"""
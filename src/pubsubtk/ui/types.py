@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING, Type, Union
+from functools import cache, lru_cache
+from typing import TYPE_CHECKING, Tuple, Type, Union
 
 if TYPE_CHECKING:
     from pubsubtk.ui.base.container_base import (
@@ -26,3 +27,25 @@ TemplateComponentType = Union[Type["TemplateComponentTk"], Type["TemplateCompone
 
 # Combined component type for general use
 ComponentType = Union[ContainerComponentType, PresentationalComponentType]
+
+
+@cache
+def _component_classes() -> Tuple[type, ...]:
+    """コンポーネント基底クラスのタプル（循環 import を避けるため初回使用時に解決）"""
+    from pubsubtk.ui.base.container_base import ContainerMixin
+    from pubsubtk.ui.base.presentational_base import PresentationalMixin
+    from pubsubtk.ui.base.template_base import TemplateMixin
+
+    return (ContainerMixin, PresentationalMixin, TemplateMixin)
+
+
+@lru_cache(maxsize=256)
+def is_component(cls: type) -> bool:
+    """クラスが PubSubTk のコンポーネントかを返す（クラスごとにキャッシュ）"""
+    return isinstance(cls, type) and issubclass(cls, _component_classes())
+
+
+@lru_cache(maxsize=256)
+def is_container_component(cls: type) -> bool:
+    """クラスが Container コンポーネントかを返す（クラスごとにキャッシュ）"""
+    return isinstance(cls, type) and issubclass(cls, _component_classes()[0])
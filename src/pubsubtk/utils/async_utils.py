@@ -16,8 +16,8 @@ def make_async(func: Callable) -> Callable:
     """
     関数を非同期関数としてラップするデコレーター。
 
-    - 同期関数の場合: asyncio.run_in_executorを利用して非同期化
-    - 非同期関数の場合: そのままawait可能な関数として返す
+    - 同期関数の場合: asyncio.to_threadを利用して非同期化
+    - 非同期関数の場合: ラップせずそのまま返す
 
     Args:
         func (Callable): 任意の関数（同期・非同期どちらでも可）
@@ -26,18 +26,13 @@ def make_async(func: Callable) -> Callable:
         Callable: 非同期関数として使える関数
     """
     if inspect.iscoroutinefunction(func):
-
-        @wraps(func)
-        async def async_wrapper(*args, **kwargs):
-            return await func(*args, **kwargs)
-
-        return async_wrapper
+        # 既に await 可能なので、ラッパーでコルーチンを 1 段増やさない
+        return func
     else:
 
         @wraps(func)
         async def sync_to_async_wrapper(*args, **kwargs):
-            loop = asyncio.get_running_loop()
-            return await loop.run_in_executor(None, lambda: func(*args, **kwargs))
+            return await asyncio.to_thread(func, *args, **kwargs)
 
         return sync_to_async_wrapper
 
@@ -47,7 +42,7 @@ def make_async_task(func: Callable) -> Callable:
     関数を即座にTaskオブジェクトとしてスケジューリングするデコレーター。
 
     - 非同期関数の場合: create_taskで即タスク化
-    - 同期関数の場合: run_in_executorで非同期化しつつタスク化
+    - 同期関数の場合: asyncio.to_threadで非同期化しつつタスク化
 
     Args:
         func (Callable): 任意の関数（同期・非同期どちらでも可）
@@ -68,10 +63,6 @@ def make_async_task(func: Callable) -> Callable:
         @wraps(func)
         def sync_task_wrapper(*args, **kwargs):
             loop = asyncio.get_event_loop()
-
-            async def _async_func():
-                return await loop.run_in_executor(None, lambda: func(*args, **kwargs))
-
-            return loop.create_task(_async_func())
+            return loop.create_task(asyncio.to_thread(func, *args, **kwargs))
 
         return sync_task_wrapper
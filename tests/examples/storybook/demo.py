@@ -1,13 +1,21 @@
 # demo_storybook.py - Storybook 起動サンプル
 """最小限の PubSubTk Storybook デモアプリ。"""
 
+import os
 import tkinter as tk
+from functools import lru_cache
 from tkinter import ttk
 
 from pubsubtk.core.pubsub_base import enable_pubsub_debug_logging
 from pubsubtk.storybook import StorybookApplication, StoryContext, story
 
 
+@lru_cache(maxsize=128)
+def _font(size: int) -> tuple:
+    """サイズ別のフォント指定（再描画のたびにタプルを作らない）"""
+    return ("Arial", size)
+
+
 # ------------------------------------------------------------------ #
 # Story 定義例
 @story("UI.Label.Primary")
@@ -24,8 +32,14 @@ def label_primary(ctx: StoryContext):
     )
 
     lbl = tk.Label(
-        ctx.parent, text=text.value, font=("Arial", size.value), fg=color.value
+        ctx.parent, text=text.value, font=_font(size.value), fg=color.value
     )
+
+    # Knob 変更時はラベルを作り直さずに設定だけ更新する
+    def update():
+        lbl.configure(text=text.value, font=_font(size.value), fg=color.value)
+
+    ctx.set_updater(update)
     return lbl
 
 
@@ -119,7 +133,9 @@ def ttk_progress_bar(ctx: StoryContext):
 if __name__ == "__main__":
     # 自動検索版を使う場合
     # discover_stories("src")  # src ディレクトリから自動検索
-    enable_pubsub_debug_logging()
+    # PUBSUBTK_DEBUG=1 の時だけ PubSub のデバッグログを出す
+    if os.environ.get("PUBSUBTK_DEBUG"):
+        enable_pubsub_debug_logging()
     # 手動版（上記のstory定義が既にここで実行されているため自動登録済み）
     app = StorybookApplication(
         title="PubSubTk Storybook Demo",
@@ -0,0 +1,199 @@
+import threading
+
+import pytest
+from pubsub import pub
+from pydantic import BaseModel, ConfigDict, ValidationError, computed_field
+
+from pubsubtk.store.store import Store
+from pubsubtk.topic.topics import DefaultUndoTopic, DefaultUpdateTopic
+
+
+class Inner(BaseModel):
+    model_config = ConfigDict(validate_assignment=True)
+
+    n: int = 0
+
+
+class ValidatedState(BaseModel):
+    model_config = ConfigDict(validate_assignment=True)
+
+    count: int = 0
+    inner: Inner = Inner()
+
+
+def test_update_state_rejects_invalid_value_with_validate_assignment():
+    store = Store(ValidatedState)
+
+    with pytest.raises(ValidationError):
+        store.update_state("count", "abc")
+    with pytest.raises(ValidationError):
+        store.update_state("inner.n", "x")
+
+    assert store.get_current_state().count == 0
+    assert store.get_current_state().inner.n == 0
+
+
+def test_update_state_coerces_value_with_validate_assignment():
+    store = Store(ValidatedState)
+
+    store.update_state("count", "5")
+    store.update_state(store.state.inner.n, "7")
+
+    assert store.get_current_state().count == 5
+    assert store.get_current_state().inner.n == 7
+
+
+def test_begin_batch_rejects_invalid_value_with_validate_assignment():
+    store = Store(ValidatedState)
+
+    with pytest.raises(ValidationError):
+        with store.begin_batch():
+            store.update_state("count", "abc")
+
+    assert store.get_current_state().count == 0
+
+
+class CounterState(BaseModel):
+    count: int = 0
+
+
+def test_update_state_with_equal_value_still_notifies():
+    store = Store(CounterState)
+    topic = f"{DefaultUpdateTopic.STATE_UPDATED}.count"
+    received = []
+
+    def on_updated():
+        received.append(store.get_value("count"))
+
+    pub.subscribe(on_updated, topic)
+    try:
+        store.update_state("count", 2)
+        store.update_state("count", 2)
+    finally:
+        pub.unsubscribe(on_updated, topic)
+
+    assert received == [2, 2]
+
+
+def test_undo_from_foreign_thread_is_applied_on_owner_thread():
+    store = Store(CounterState)
+    store.set_owner_thread()
+    store._enable_undo_redo("count")
+    store.update_state("count", 1)
+    store.update_state("count", 2)
+
+    def worker():
+        store.update_state("count", 50)
+        store._undo("count")
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    assert store.get_value("count") == 2
+
+    store.flush()
+
+    assert store.get_value("count") == 2
+    assert store._undo_stacks["count"] == [0, 1]
+    assert store._redo_stacks["count"] == [50]
+
+
+def test_flush_keeps_applying_after_a_failed_update():
+    store = Store(CounterState)
+    store.set_owner_thread()
+
+    def worker():
+        store.update_state("missing", 1)
+        store.update_state("count", 3)
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+
+    assert store.flush() is True
+    assert store.get_value("count") == 3
+
+
+def test_notifications_are_sent_outside_the_write_lock():
+    store = Store(CounterState)
+    store._enable_undo_redo("count")
+    lock_held = []
+
+    def on_updated():
+        lock_held.append(store._write_lock._is_owned())
+
+    def on_status(can_undo, can_redo, undo_count, redo_count):
+        lock_held.append(store._write_lock._is_owned())
+
+    listeners = {
+        f"{DefaultUpdateTopic.STATE_UPDATED}.count": on_updated,
+        f"{DefaultUndoTopic.STATUS_CHANGED}.count": on_status,
+    }
+    for topic, listener in listeners.items():
+        pub.subscribe(listener, topic)
+    try:
+        store.update_state("count", 1)
+        store._undo("count")
+        store._redo("count")
+    finally:
+        for topic, listener in listeners.items():
+            pub.unsubscribe(listener, topic)
+
+    assert lock_held and not any(lock_held)
+    assert store.get_value("count") == 1
+
+
+class ListState(BaseModel):
+    items: list[int] = []
+    inner: Inner = Inner()
+
+
+def test_state_view_shares_containers_and_keeps_models_read_only():
+    store = Store(ListState)
+    store.update_state("items", [1, 2])
+
+    view = store.get_state_view()
+
+    assert view.items == [1, 2]
+    assert view.items is store.get_value("items")
+    assert view.inner == Inner()
+    with pytest.raises(AttributeError):
+        view.inner.n = 1
+
+
+def test_begin_batch_does_not_absorb_updates_from_other_threads():
+    store = Store(CounterState)
+
+    with store.begin_batch():
+        worker = threading.Thread(target=store.update_state, args=("count", 5))
+        worker.start()
+        worker.join()
+        # 別スレッドの更新はバッチに溜まらずその場で適用される
+        assert store.get_current_state().count == 5
+
+
+class DerivedState(BaseModel):
+    first: str = "a"
+    last: str = "b"
+    inner: Inner = Inner()
+
+    @computed_field
+    @property
+    def full(self) -> str:
+        return f"{self.first} {self.last}"
+
+    @property
+    def copy_of_inner(self) -> Inner:
+        return self.inner
+
+
+def test_state_proxy_accepts_computed_fields_and_properties():
+    store = Store(DerivedState)
+
+    assert str(store.state.full) == "DerivedState.full"
+    assert str(store.state.copy_of_inner.n) == "DerivedState.copy_of_inner.n"
+    assert store.get_value(str(store.state.full)) == "a b"
+    with pytest.raises(AttributeError):
+        store.state.missing
+    with pytest.raises(AttributeError):
+        store.state.copy_of_inner.missing